@@ -10,10 +10,6 @@ Then start the frontend (npm run dev) and use the AI Agent Chat.
 Set GOOGLE_API_KEY or GEMINI_API_KEY in .env for Gemini-powered step generation.
 """
 import uvicorn
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent))
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -21,4 +17,5 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        limit_concurrency=1000,  # shed load with 503s instead of queueing without bound
     )
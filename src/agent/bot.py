@@ -6,15 +6,214 @@ using LangChain to reason about cloud operations while respecting policy constra
 """
 
 import os
-import sys
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+import time
+import logging
+import copy
+import asyncio
+import hashlib
+import functools
+import importlib.util
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Callable, Tuple, TypedDict, AsyncIterator
 import httpx
 from langchain_classic.agents import AgentExecutor, create_tool_calling_agent
-from langchain_core.tools import Tool
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
 from langchain_core.prompts import ChatPromptTemplate
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from langchain_core.messages import SystemMessage
+
+from ..log_queue import get_queued_logger
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup; stdlib fallback
+    import json
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    
+    _json_loads = json.loads
+
+# Agent logging goes through the shared queue listener (see src/log_queue.py)
+logger = get_queued_logger(__name__)
+
+# Prefix of tool observations for policy-blocked calls (also how steps are flagged "blocked")
+POLICY_BLOCKED_MARKER = "POLICY BLOCKED"
+
+# Run LangChain callback handlers (tracing uploads etc.) off the agent's critical path
+os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
+
+_JSON_HEADERS = {"content-type": "application/json"}
+# httpx only advertises br when the brotli package is importable
+_ACCEPT_ENCODING = "gzip, br" if importlib.util.find_spec("brotli") else "gzip"
+_MCP_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_MCP_CONNECT_RETRIES = 1
+
+# HTTP/2 multiplexing needs the optional `h2` package (pip install httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+# Static SRE system prompt (immutable prompt prefix). Keep it free of per-call data
+# (timestamps, mode, ...) so provider prompt/prefix caches can reuse it across
+# invocations; anything that varies goes into the mode-hint message after it.
+SYSTEM_PROMPT = """You are Proxi, an AI Site Reliability Engineer managing cloud infrastructure.
+
+Your mission is to maintain system health and resolve incidents while strictly adhering to security policies.
+
+CRITICAL POLICY AWARENESS:
+- You operate under a Policy Engine that enforces context-aware security constraints
+- In NORMAL mode: You can only READ data (get_service_status, read_logs)
+- In EMERGENCY mode: You can take corrective actions (restart_service, scale_fleet) BUT still cannot perform destructive operations
+- Destructive operations like delete_database are ALWAYS BLOCKED regardless of mode
+
+BEHAVIORAL GUIDELINES:
+1. When a tool is blocked by policy, DO NOT retry it - the policy is absolute
+2. If blocked, acknowledge the policy constraint and explain WHY it's blocked
+3. Suggest alternative safer approaches when your preferred action is blocked
+4. Always check service status before attempting corrective actions
+5. Be transparent about what you can and cannot do in the current mode
+
+RESPONSE STYLE:
+- Be concise and professional
+- When blocked, explain the policy reason clearly
+- Propose alternative solutions when primary action is unavailable
+- Show your reasoning process step by step
+
+Remember: Safety and policy compliance come before speed of resolution."""
+
+
+class _NoArgs(BaseModel):
+    pass
+
+
+class _ServiceStatusArgs(BaseModel):
+    service_name: Optional[str] = Field(default=None, description="Service to check; omit for all services")
+
+
+class _ReadLogsArgs(BaseModel):
+    lines: int = Field(default=10, description="Number of log lines to read")
+
+
+class _ServiceNameArgs(BaseModel):
+    service_name: str = Field(description="Exact service identifier (see list_services)")
+
+
+class _ScaleFleetArgs(BaseModel):
+    count: int = Field(description="Target number of instances")
+
+
+class _DatabaseArgs(BaseModel):
+    db_name: str = Field(description="Database name")
+
+
+# MCP tools exposed to the LLM: (name, args schema, description).
+# Typed schemas let LangChain validate/coerce tool input with Pydantic's core
+# validator instead of per-call Python coercion in the tool functions.
+_TOOL_SPECS = (
+    ("list_services", _NoArgs,
+     "List all available services and their exact identifiers."),
+    ("get_service_status", _ServiceStatusArgs,
+     "Get the current health status of cloud services. "
+     "Use this to diagnose issues. No arguments needed for all services, "
+     "or provide service_name for specific service."),
+    ("read_logs", _ReadLogsArgs,
+     "Read recent system logs. Provide number of lines to read (default 10)."),
+    ("restart_service", _ServiceNameArgs,
+     "Restart a cloud service. WARNING: Only available in EMERGENCY mode. "
+     "Requires service_name parameter."),
+    ("scale_fleet", _ScaleFleetArgs,
+     "Scale the number of service instances. WARNING: Only available in EMERGENCY mode. "
+     "Requires count parameter (integer)."),
+    ("delete_database", _DatabaseArgs,
+     "Delete a database. WARNING: DESTRUCTIVE OPERATION - Always blocked by policy."),
+)
+
+
+# Mutable suffix: second system message, rendered per call
+_MODE_HINT_TEMPLATE = "Current operational mode reported by the Policy Engine: {mode}"
+
+
+def _executor_input(task: str, mode: str) -> Dict[str, str]:
+    return {"input": task, "mode_hint": _MODE_HINT_TEMPLATE.format(mode=mode)}
+
+
+class ExecutorResult(TypedDict):
+    """What AgentExecutor.invoke/ainvoke returns with return_intermediate_steps=True."""
+    input: str
+    output: Any  # str for most providers; content parts for some
+    intermediate_steps: List[Any]
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_llm_factory() -> Tuple[str, Callable[[], Any]]:
+    """
+    Probe the configured LLM provider once and return (provider, zero-arg factory).
+    
+    Provider packages are checked with find_spec before importing, so missing
+    integrations are skipped without going through the ImportError machinery.
+    Raises RuntimeError (not cached) when no provider/API key is configured.
+    """
+    # Gemini (Google) - prefer GOOGLE_API_KEY or GEMINI_API_KEY
+    api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+    if api_key and importlib.util.find_spec("langchain_google_genai"):
+        try:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            return "google", functools.partial(
+                ChatGoogleGenerativeAI,
+                model="gemini-2.5-flash",
+                temperature=0,
+                api_key=api_key
+            )
+        except Exception:
+            pass
+    if os.getenv("OPENAI_API_KEY") and importlib.util.find_spec("langchain_openai"):
+        try:
+            from langchain_openai import ChatOpenAI
+            return "openai", functools.partial(ChatOpenAI, model="gpt-4", temperature=0)
+        except Exception:
+            pass
+    if os.getenv("ANTHROPIC_API_KEY") and importlib.util.find_spec("langchain_anthropic"):
+        try:
+            from langchain_anthropic import ChatAnthropic
+            return "anthropic", functools.partial(ChatAnthropic, model="claude-3-sonnet-20240229", temperature=0)
+        except Exception:
+            pass
+    raise RuntimeError(
+        "No LLM API key found. Set one of these in .env: "
+        "GOOGLE_API_KEY, GEMINI_API_KEY, OPENAI_API_KEY, ANTHROPIC_API_KEY"
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_llm() -> Tuple[str, Any]:
+    """
+    Build the chat model once per process and share it across ProxiAgent instances.
+    
+    Chat models hold no per-conversation state, so one client (and its HTTP/gRPC
+    channel) serves every agent. Set PROXI_LLM_CACHE to a SQLite path to also reuse
+    identical LLM calls across processes (needs langchain_community).
+    """
+    provider, factory = _resolve_llm_factory()
+    
+    cache_path = os.getenv("PROXI_LLM_CACHE")
+    if cache_path and importlib.util.find_spec("langchain_community"):
+        from langchain_core.globals import set_llm_cache
+        from langchain_community.cache import SQLiteCache
+        set_llm_cache(SQLiteCache(database_path=cache_path))
+    
+    return provider, factory()
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_tool_request(tool_name: str, args_key: tuple) -> bytes:
+    """Serialized /tools/execute body, memoized per (tool, arguments) pair."""
+    return _json_dumps({
+        "tool_name": tool_name,
+        "arguments": dict(args_key),
+        "context": {}
+    })
 
 
 class ProxiAgent:
@@ -25,47 +224,69 @@ class ProxiAgent:
     infrastructure issues while respecting security policies.
     """
     
+    # Seconds a fetched operational mode is reused by get_current_mode()
+    MODE_CACHE_TTL = 2.0
+    
+    # Run name of the top-level executor run, used to find its end event in astream()
+    _RUN_NAME = "proxi"
+    
+    # Max read-only MCP calls in flight per agent when one LLM turn requests several tools
+    TOOL_CONCURRENCY_LIMIT = 4
+    
+    # Repeated read-only tasks (same text, mode and server state) are answered from memory
+    RESPONSE_CACHE_TTL = 30.0
+    RESPONSE_CACHE_SIZE = 128
+    _READ_ONLY_TOOLS = frozenset({"list_services", "get_service_status", "read_logs"})
+    
+    # State-changing tools are never run in parallel with each other
+    _SERIAL_TOOLS = frozenset({"restart_service", "scale_fleet", "delete_database"})
+    
+    
     def __init__(self, mcp_server_url: str = "http://localhost:8000"):
         """
         Initialize the Proxi Agent. LLM is configured via .env only.
         Requires one of: GOOGLE_API_KEY, GEMINI_API_KEY, OPENAI_API_KEY, ANTHROPIC_API_KEY.
         """
         self.mcp_server_url = mcp_server_url
-        self.client = httpx.Client(timeout=30.0)
+        # Primary client: async, pooled keep-alive (HTTP/2 when available), lives as long as the agent
+        # (connect failures are retried once by the transport before surfacing)
+        self.client = httpx.AsyncClient(
+            base_url=mcp_server_url,
+            headers={"accept-encoding": _ACCEPT_ENCODING},
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=_MCP_CLIENT_LIMITS,
+                retries=_MCP_CONNECT_RETRIES
+            )
+        )
+        # Blocking fallback for run()/get_current_mode() callers without an event loop
+        self.sync_client = httpx.Client(
+            base_url=mcp_server_url,
+            headers={"accept-encoding": _ACCEPT_ENCODING},
+            timeout=30.0,
+            transport=httpx.HTTPTransport(
+                limits=_MCP_CLIENT_LIMITS,
+                retries=_MCP_CONNECT_RETRIES
+            )
+        )
+        # (fetched_at, mode, server state token or None)
+        self._mode_cache: Tuple[float, str, Optional[tuple]] = (float("-inf"), "UNKNOWN", None)
+        self._response_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._tool_semaphore: Optional[asyncio.Semaphore] = None
+        self._write_lock: Optional[asyncio.Lock] = None
         self.tools = self._create_tools()
         self.llm = self._create_llm()
-        self.agent_executor = self._create_agent()
+    
+    @functools.cached_property
+    def agent_executor(self) -> AgentExecutor:
+        """LangChain executor, built on first use (constructing an agent stays cheap)."""
+        return self._create_agent()
 
     def _create_llm(self):
-        """Create the LLM from .env. Requires at least one API key in .env."""
-        # Gemini (Google) - prefer GOOGLE_API_KEY or GEMINI_API_KEY
-        try:
-            from langchain_google_genai import ChatGoogleGenerativeAI
-            api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-            if api_key:
-                return ChatGoogleGenerativeAI(
-                    model="gemini-2.5-flash",
-                    temperature=0,
-                    api_key=api_key
-                )
-        except Exception:
-            pass
-        try:
-            from langchain_openai import ChatOpenAI
-            if os.getenv("OPENAI_API_KEY"):
-                return ChatOpenAI(model="gpt-4", temperature=0)
-        except Exception:
-            pass
-        try:
-            from langchain_anthropic import ChatAnthropic
-            if os.getenv("ANTHROPIC_API_KEY"):
-                return ChatAnthropic(model="claude-3-sonnet-20240229", temperature=0)
-        except Exception:
-            pass
-        raise RuntimeError(
-            "No LLM API key found. Set one of these in .env: "
-            "GOOGLE_API_KEY, GEMINI_API_KEY, OPENAI_API_KEY, ANTHROPIC_API_KEY"
-        )
+        """Get the process-wide LLM from .env. Requires at least one API key in .env."""
+        self.llm_provider, llm = _shared_llm()
+        return llm
     
     def _execute_mcp_tool(self, tool_name: str, **kwargs) -> str:
         """
@@ -74,102 +295,96 @@ class ProxiAgent:
         This method sends tool execution requests to the MCP server,
         which enforces policy validation before execution.
         """
+        return self._post_tool(tool_name, tuple(sorted(kwargs.items())))
+    
+    async def _aexecute_mcp_tool(self, tool_name: str, **kwargs) -> str:
+        """Async variant of _execute_mcp_tool; lets independent tool calls overlap."""
+        return await self._apost_tool(tool_name, tuple(sorted(kwargs.items())))
+    
+    def _post_tool(self, tool_name: str, args_key: tuple) -> str:
+        """POST a /tools/execute request whose body is memoized per (tool, args_key)."""
         try:
-            response = self.client.post(
-                f"{self.mcp_server_url}/tools/execute",
-                json={
-                    "tool_name": tool_name,
-                    "arguments": kwargs,
-                    "context": {}
-                }
+            response = self.sync_client.post(
+                "/tools/execute",
+                content=_encode_tool_request(tool_name, args_key),
+                headers=_JSON_HEADERS
             )
             response.raise_for_status()
-            result = response.json()
-            
-            if result.get("policy_violation"):
-                return f"❌ POLICY BLOCKED: {result.get('blocked_reason', 'Unknown reason')}"
-            elif result.get("success"):
-                return f"✓ Success: {result.get('result', 'Operation completed')}"
-            else:
-                return f"❌ Error: {result.get('error', 'Unknown error')}"
+            return self._format_tool_result(_json_loads(response.content))
                 
         except Exception as e:
             return f"❌ Connection error: {str(e)}"
     
-    def _create_tools(self) -> List[Tool]:
-        """Create LangChain tools that wrap MCP server endpoints."""
-        return [
-            Tool(
-                name="list_services",
-                func=lambda: self._execute_mcp_tool("list_services"),
-                description="List all available services and their exact identifiers."
-            ),
-            Tool(
-                name="get_service_status",
-                func=lambda service_name=None: self._execute_mcp_tool(
-                    "get_service_status", 
-                    service_name=service_name if service_name else None
-                ),
-                description="Get the current health status of cloud services. "
-                           "Use this to diagnose issues. No arguments needed for all services, "
-                           "or provide service_name for specific service."
-            ),
-            Tool(
-                name="read_logs",
-                func=lambda lines=10: self._execute_mcp_tool("read_logs", lines=int(lines)),
-                description="Read recent system logs. Provide number of lines to read (default 10)."
-            ),
-            Tool(
-                name="restart_service",
-                func=lambda service_name: self._execute_mcp_tool(
-                    "restart_service", 
-                    service_name=service_name
-                ),
-                description="Restart a cloud service. WARNING: Only available in EMERGENCY mode. "
-                           "Requires service_name parameter."
-            ),
-            Tool(
-                name="scale_fleet",
-                func=lambda count: self._execute_mcp_tool("scale_fleet", count=int(count)),
-                description="Scale the number of service instances. WARNING: Only available in EMERGENCY mode. "
-                           "Requires count parameter (integer)."
-            ),
-            Tool(
-                name="delete_database",
-                func=lambda db_name: self._execute_mcp_tool("delete_database", db_name=db_name),
-                description="Delete a database. WARNING: DESTRUCTIVE OPERATION - Always blocked by policy."
+    async def _apost_tool(self, tool_name: str, args_key: tuple) -> str:
+        try:
+            response = await self.client.post(
+                "/tools/execute",
+                content=_encode_tool_request(tool_name, args_key),
+                headers=_JSON_HEADERS
             )
-        ]
+            response.raise_for_status()
+            return self._format_tool_result(_json_loads(response.content))
+                
+        except Exception as e:
+            return f"❌ Connection error: {str(e)}"
+    
+    @staticmethod
+    def _format_tool_result(result: Dict[str, Any]) -> str:
+        """Turn an MCP /tools/execute response into the observation string for the LLM."""
+        if result.get("policy_violation"):
+            return f"❌ {POLICY_BLOCKED_MARKER}: {result.get('blocked_reason', 'Unknown reason')}"
+        elif result.get("success"):
+            return f"✓ Success: {result.get('result', 'Operation completed')}"
+        else:
+            return f"❌ Error: {result.get('error', 'Unknown error')}"
+    
+    def _create_tools(self) -> List[StructuredTool]:
+        """Create LangChain tools that wrap MCP server endpoints."""
+        tools = []
+        for name, args_schema, description in _TOOL_SPECS:
+            func, coroutine = self._bind_tool(name)
+            tools.append(StructuredTool.from_function(
+                func=func,
+                coroutine=coroutine,
+                name=name,
+                description=description,
+                args_schema=args_schema
+            ))
+        return tools
+    
+    def _bind_tool(self, tool_name: str) -> Tuple[Callable[..., str], Callable[..., Any]]:
+        """Sync/async callables for one tool; kwargs arrive already validated by its schema."""
+        def call(**kwargs: Any) -> str:
+            return self._post_tool(tool_name, tuple(sorted(kwargs.items())))
+        
+        async def acall(**kwargs: Any) -> str:
+            return await self._acall_tool(tool_name, tuple(sorted(kwargs.items())))
+        
+        return call, acall
+    
+    async def _acall_tool(self, tool_name: str, args_key: tuple) -> str:
+        """
+        Async tool entry point. AgentExecutor.ainvoke gathers all tool calls of one
+        LLM turn; read-only tools overlap (capped at TOOL_CONCURRENCY_LIMIT) while
+        state-changing tools are serialized so they never race each other.
+        """
+        if self._tool_semaphore is None:
+            # Created lazily so they bind to the loop that actually runs the agent
+            self._tool_semaphore = asyncio.Semaphore(self.TOOL_CONCURRENCY_LIMIT)
+            self._write_lock = asyncio.Lock()
+        
+        if tool_name in self._SERIAL_TOOLS:
+            async with self._write_lock:
+                return await self._apost_tool(tool_name, args_key)
+        async with self._tool_semaphore:
+            return await self._apost_tool(tool_name, args_key)
     
     def _create_agent(self) -> AgentExecutor:
         """Create the LangChain agent with system prompt."""
-        system_prompt = """You are Proxi, an AI Site Reliability Engineer managing cloud infrastructure.
-
-Your mission is to maintain system health and resolve incidents while strictly adhering to security policies.
-
-CRITICAL POLICY AWARENESS:
-- You operate under a Policy Engine that enforces context-aware security constraints
-- In NORMAL mode: You can only READ data (get_service_status, read_logs)
-- In EMERGENCY mode: You can take corrective actions (restart_service, scale_fleet) BUT still cannot perform destructive operations
-- Destructive operations like delete_database are ALWAYS BLOCKED regardless of mode
-
-BEHAVIORAL GUIDELINES:
-1. When a tool is blocked by policy, DO NOT retry it - the policy is absolute
-2. If blocked, acknowledge the policy constraint and explain WHY it's blocked
-3. Suggest alternative safer approaches when your preferred action is blocked
-4. Always check service status before attempting corrective actions
-5. Be transparent about what you can and cannot do in the current mode
-
-RESPONSE STYLE:
-- Be concise and professional
-- When blocked, explain the policy reason clearly
-- Propose alternative solutions when primary action is unavailable
-- Show your reasoning process step by step
-
-Remember: Safety and policy compliance come before speed of resolution."""
-
+        # Immutable preamble first (cacheable prefix), then the per-call mode hint
         prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
+            self._system_message(),
+            ("system", "{mode_hint}"),
             ("human", "{input}"),
             ("placeholder", "{agent_scratchpad}")
         ])
@@ -177,33 +392,39 @@ Remember: Safety and policy compliance come before speed of resolution."""
         return AgentExecutor(
             agent=agent,
             tools=self.tools,
-            verbose=True,
+            verbose=False,
             return_intermediate_steps=True
         )
 
+    def _system_message(self) -> SystemMessage:
+        """
+        Static system prompt, passed as a concrete message so it is never re-templated.
+        
+        The text is byte-identical on every call, so Gemini/OpenAI implicit prefix
+        caching can reuse it; Anthropic needs an explicit cache_control breakpoint.
+        """
+        if self.llm_provider == "anthropic":
+            return SystemMessage(content=[{
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"}
+            }])
+        return SystemMessage(content=SYSTEM_PROMPT)
+
     def _normalize_steps(self, raw_steps: Any) -> List[Dict[str, Any]]:
         """Convert LangChain intermediate_steps to a uniform format for the frontend."""
         steps = []
         if not raw_steps:
             return steps
-        for i, item in enumerate(raw_steps):
-            if isinstance(item, (list, tuple)) and len(item) >= 2:
+        for i, item in enumerate(raw_steps, 1):
+            # LangChain's default: (AgentAction, observation) tuples
+            if type(item) is tuple and len(item) == 2:
+                action, observation = item
+            elif isinstance(item, (list, tuple)) and len(item) >= 2:
                 action, observation = item[0], item[1]
-                tool_name = getattr(action, "tool", None) or (action.get("tool") if isinstance(action, dict) else "?")
-                tool_input = getattr(action, "tool_input", None) or (action.get("tool_input") if isinstance(action, dict) else {})
-                log = getattr(action, "log", None) or (action.get("log") if isinstance(action, dict) else "")
-                steps.append({
-                    "step_number": i + 1,
-                    "thought": log or f"Use tool: {tool_name}",
-                    "action": tool_name,
-                    "tool_name": tool_name,
-                    "tool_input": tool_input,
-                    "result": str(observation)[:500],
-                    "blocked": "POLICY BLOCKED" in str(observation),
-                })
             elif isinstance(item, dict):
                 steps.append({
-                    "step_number": item.get("step_number", i + 1),
+                    "step_number": item.get("step_number", i),
                     "thought": item.get("thought", ""),
                     "action": item.get("action", item.get("tool_name", "")),
                     "tool_name": item.get("tool_name", item.get("action", "")),
@@ -211,11 +432,34 @@ Remember: Safety and policy compliance come before speed of resolution."""
                     "result": item.get("result", ""),
                     "blocked": item.get("blocked", False),
                 })
+                continue
+            else:
+                continue
+            
+            try:
+                tool_name, tool_input, log = action.tool, action.tool_input, action.log
+            except AttributeError:
+                if isinstance(action, dict):
+                    tool_name, tool_input, log = action.get("tool"), action.get("tool_input"), action.get("log")
+                else:
+                    tool_name, tool_input, log = None, None, None
+            tool_name = tool_name or "?"
+            
+            observation_str = observation if type(observation) is str else str(observation)
+            steps.append({
+                "step_number": i,
+                "thought": log or f"Use tool: {tool_name}",
+                "action": tool_name,
+                "tool_name": tool_name,
+                "tool_input": tool_input or {},
+                "result": observation_str if len(observation_str) <= 500 else observation_str[:500],
+                "blocked": POLICY_BLOCKED_MARKER in observation_str,
+            })
         return steps
 
     def run(self, task: str) -> Dict[str, Any]:
         """
-        Execute a task through the agent.
+        Execute a task through the agent (blocking; prefer arun() inside an event loop).
         
         Args:
             task: The task description or question
@@ -223,34 +467,237 @@ Remember: Safety and policy compliance come before speed of resolution."""
         Returns:
             Dictionary with response, steps (for frontend flow), success, task, error.
         """
-        print(f"\n{'='*70}")
-        print(f"📋 AGENT TASK: {task}")
-        print(f"{'='*70}\n")
+        self._log_task_header(task)
+        
+        mode = self.get_current_mode()
+        cache_key = self._response_cache_key(task, mode, self._mode_cache[2])
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            result = self.agent_executor.invoke({"input": task})
-            output = result.get("output", str(result))
-            raw_steps = result.get("intermediate_steps", [])
-            steps = self._normalize_steps(raw_steps)
-            return {
-                "success": True,
-                "task": task,
-                "response": output,
-                "steps": steps,
-            }
+            result = self.agent_executor.invoke(_executor_input(task, mode))
+            return self._cache_store(cache_key, self._build_result(task, result))
         except Exception as e:
-            return {
-                "success": False,
-                "task": task,
-                "error": str(e),
-                "response": str(e),
-                "steps": [],
-            }
+            return self._build_error(task, e)
+    
+    async def arun(self, task: str) -> Dict[str, Any]:
+        """
+        Execute a task through the agent on the running event loop.
+        
+        Tool calls go through the agent's pooled AsyncClient (self.client), and
+        the executor runs independent tool calls from a single LLM turn concurrently.
+        """
+        self._log_task_header(task)
+        
+        mode = await self.aget_current_mode()
+        cache_key = self._response_cache_key(task, mode, self._mode_cache[2])
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            result = await self.agent_executor.ainvoke(_executor_input(task, mode))
+            return self._cache_store(cache_key, self._build_result(task, result))
+        except Exception as e:
+            return self._build_error(task, e)
+    
+    async def astream(self, task: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a task's progress as events (for SSE/WebSocket frontends).
+        
+        Yields "token" events as the LLM writes, "tool_start"/"tool_end" around
+        each MCP call, and a final "result" event shaped like run()'s return value.
+        """
+        try:
+            mode = await self.aget_current_mode()
+            async for event in self.agent_executor.astream_events(
+                _executor_input(task, mode), version="v2", config={"run_name": self._RUN_NAME}
+            ):
+                kind = event["event"]
+                if kind == "on_chat_model_stream":
+                    content = event["data"]["chunk"].content
+                    if content:
+                        yield {
+                            "type": "token",
+                            "content": content if isinstance(content, str) else str(content)
+                        }
+                elif kind == "on_tool_start":
+                    yield {
+                        "type": "tool_start",
+                        "tool_name": event["name"],
+                        "tool_input": event["data"].get("input")
+                    }
+                elif kind == "on_tool_end":
+                    observation = str(event["data"].get("output"))
+                    yield {
+                        "type": "tool_end",
+                        "tool_name": event["name"],
+                        "result": observation[:500],
+                        "blocked": POLICY_BLOCKED_MARKER in observation
+                    }
+                elif kind == "on_chain_end" and event["name"] == self._RUN_NAME:
+                    yield {"type": "result", **self._build_result(task, event["data"]["output"])}
+        except Exception as e:
+            yield {"type": "result", **self._build_error(task, e)}
+    
+    async def run_batch_async(self, tasks: List[str], max_concurrency: int = 8,
+                              delay_between_batches: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Execute several independent tasks concurrently on one event loop.
+        
+        Args:
+            tasks: Task descriptions, each handled like arun()
+            max_concurrency: Max agent turns in flight (shared HTTP client, provider budget)
+            delay_between_batches: If set, tasks are sent in groups of max_concurrency
+                with this many seconds between groups (provider RPM limits)
+        
+        Returns:
+            One result dict per task, in order, shaped like run()'s return value.
+        """
+        results: List[Dict[str, Any]] = []
+        mode = await self.aget_current_mode()
+        group_size = max_concurrency if delay_between_batches else max(len(tasks), 1)
+        
+        for start in range(0, len(tasks), group_size):
+            if start and delay_between_batches:
+                await asyncio.sleep(delay_between_batches)
+            group = tasks[start:start + group_size]
+            outputs = await self.agent_executor.abatch(
+                [_executor_input(task, mode) for task in group],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True
+            )
+            for task, output in zip(group, outputs):
+                if isinstance(output, Exception):
+                    results.append(self._build_error(task, output))
+                else:
+                    results.append(self._build_result(task, output))
+        return results
+    
+    # ==================== RESPONSE CACHE ====================
+    
+    @staticmethod
+    def _response_cache_key(task: str, mode: str, state: Optional[tuple]) -> Optional[str]:
+        """Exact-match key for a task in a given mode and server state.
+        
+        `state` is the policy/infrastructure version pair from /policy/status, so
+        any health, fleet or policy change makes earlier answers unreachable.
+        None when the mode or state is unknown (nothing is cached then).
+        """
+        if mode == "UNKNOWN" or state is None:
+            return None
+        normalized = " ".join(task.split())
+        return hashlib.sha256(f"{mode}\x00{state}\x00{normalized}".encode()).hexdigest()
+    
+    def _cache_lookup(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= self.RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        # Deep copy: callers get their own steps list and step dicts
+        return copy.deepcopy(result)
+    
+    def _cache_store(self, key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Remember a successful turn if it only used read-only tools; returns result."""
+        if key is None or not result["success"]:
+            return result
+        if any(step["tool_name"] not in self._READ_ONLY_TOOLS for step in result["steps"]):
+            return result
+        
+        self._response_cache[key] = (time.monotonic(), result)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return result
+    
+    def clear_response_cache(self) -> None:
+        self._response_cache.clear()
+    
+    @staticmethod
+    def _log_task_header(task: str) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n%s\n📋 AGENT TASK: %s\n%s\n", "=" * 70, task, "=" * 70)
+    
+    def _build_result(self, task: str, result: ExecutorResult) -> Dict[str, Any]:
+        output = result["output"]
+        steps = self._normalize_steps(result["intermediate_steps"])
+        return {
+            "success": True,
+            "task": task,
+            # Some providers return content parts; callers always get a str
+            "response": output if isinstance(output, str) else str(output),
+            "error": "",
+            "steps": steps,
+        }
+    
+    @staticmethod
+    def _build_error(task: str, error: Exception) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "task": task,
+            "error": str(error),
+            "response": str(error),
+            "steps": [],
+        }
     
     def get_current_mode(self) -> str:
-        """Get the current operational mode from the MCP server."""
+        """Get the current operational mode from the MCP server (cached briefly)."""
+        now = time.monotonic()
+        fetched_at, mode, _ = self._mode_cache
+        if now - fetched_at < self.MODE_CACHE_TTL:
+            return mode
+        
+        mode, state = "UNKNOWN", None
+        try:
+            response = self.sync_client.get("/policy/status", timeout=1.0)
+            mode, state = self._parse_status(response.content)
+        except (httpx.HTTPError, ValueError):
+            pass
+        self._mode_cache = (now, mode, state)
+        return mode
+    
+    async def aget_current_mode(self) -> str:
+        """Async get_current_mode() over the pooled AsyncClient (same cache)."""
+        now = time.monotonic()
+        fetched_at, mode, _ = self._mode_cache
+        if now - fetched_at < self.MODE_CACHE_TTL:
+            return mode
+        
+        mode, state = "UNKNOWN", None
         try:
-            response = self.client.get(f"{self.mcp_server_url}/policy/status")
-            return response.json().get("current_mode", "UNKNOWN")
-        except:
-            return "UNKNOWN"
+            response = await self.client.get("/policy/status", timeout=1.0)
+            mode, state = self._parse_status(response.content)
+        except (httpx.HTTPError, ValueError):
+            pass
+        self._mode_cache = (now, mode, state)
+        return mode
+    
+    @staticmethod
+    def _parse_status(content: bytes) -> Tuple[str, Optional[tuple]]:
+        """Mode and (policy, infrastructure) state versions from a /policy/status body."""
+        status = _json_loads(content)
+        versions = (status.get("state_version"), status.get("infra_state_version"))
+        # A server that does not report both versions gets no response caching
+        state = None if None in versions else versions
+        return status.get("current_mode", "UNKNOWN"), state
+    
+    def invalidate_mode_cache(self) -> None:
+        """Drop the cached mode and cached answers (call after changing server state)."""
+        self._mode_cache = (float("-inf"), "UNKNOWN", None)
+        self._response_cache.clear()
+    
+    def close(self) -> None:
+        """Close the blocking HTTP client (use aclose() to also close the async one)."""
+        self.sync_client.close()
+    
+    async def aclose(self) -> None:
+        """Close both HTTP clients (call from the event loop that used the agent)."""
+        self.sync_client.close()
+        await self.client.aclose()
@@ -1,5 +1,5 @@
 """Guardrails package"""
-from .policy_engine import PolicyEngine, PolicyViolationError
+from .policy_engine import PolicyEngine, PolicyViolationError, JsonlAuditSink
 from .impact_simulator import ImpactSimulator
 
-__all__ = ['PolicyEngine', 'PolicyViolationError', 'ImpactSimulator']
+__all__ = ['PolicyEngine', 'PolicyViolationError', 'JsonlAuditSink', 'ImpactSimulator']
@@ -5,8 +5,119 @@ Simulates tool execution without performing real actions,
 providing impact reports for user review before execution.
 """
 
+import time
+from types import MappingProxyType
 from typing import Dict, Any
-from datetime import datetime
+
+
+def _now_iso() -> str:
+    """Second-resolution local ISO-8601 timestamp (cheaper than datetime.now().isoformat())."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+# Restart impact estimates per service type
+SERVICE_IMPORTANCE = MappingProxyType({
+    "web-server": MappingProxyType({"users": 5000, "revenue_per_minute": 1000}),
+    "api-gateway": MappingProxyType({"users": 3000, "revenue_per_minute": 800}),
+    "database": MappingProxyType({"users": 10000, "revenue_per_minute": 2000}),
+    "cache": MappingProxyType({"users": 2000, "revenue_per_minute": 300}),
+    "load-balancer": MappingProxyType({"users": 8000, "revenue_per_minute": 1500})
+})
+_DEFAULT_IMPORTANCE = MappingProxyType({"users": 1000, "revenue_per_minute": 100})
+
+RESTART_DOWNTIME_SECONDS = 15
+
+# Fleet cost model (example: $0.10 per instance per hour, 730 hours/month)
+HOURLY_COST_PER_INSTANCE = 0.10
+MONTHLY_HOURS = 730
+_MONTHLY_COST_PER_INSTANCE = HOURLY_COST_PER_INSTANCE * MONTHLY_HOURS
+
+_RESTART_ALTERNATIVES_HEALTHY = (
+    "Check service logs first",
+    "Scale fleet to handle load",
+    "Monitor without intervention"
+)
+_SCALE_ALTERNATIVES = (
+    "Monitor current load first",
+    "Scale gradually in steps",
+    "Set auto-scaling threshold instead"
+)
+
+# Static parts of the constant-shaped reports; per-call fields are merged in.
+# Top-level values are immutable (str/bool/tuple) because {**template} shares
+# them with every report; nested dicts are built fresh in the report helpers.
+_DELETE_TEMPLATE = MappingProxyType({
+    "action": "delete_database",
+    "risk_level": "CRITICAL",
+    "reversible": False,
+    "alternatives": (
+        "Archive old data instead of deleting",
+        "Scale up storage capacity",
+        "Create backup before any operation",
+        "Contact DBA for safe data cleanup",
+        "Use data retention policies"
+    ),
+    "recommendation": "❌ NEVER PROCEED - Use alternatives",
+    "warnings": (
+        "This action is ALWAYS BLOCKED by policy",
+        "No legitimate use case for this operation",
+        "Permanent data loss",
+        "Violates data retention requirements"
+    )
+})
+
+_STATUS_TEMPLATE = MappingProxyType({
+    "action": "get_service_status",
+    "risk_level": "none",
+    "reversible": True,
+    "recommendation": "✓ Safe to proceed - read-only operation"
+})
+
+_READ_LOGS_TEMPLATE = MappingProxyType({
+    "action": "read_logs",
+    "risk_level": "none",
+    "reversible": True,
+    "recommendation": "✓ Safe to proceed - read-only operation"
+})
+
+_DEFAULT_TEMPLATE = MappingProxyType({
+    "summary": "Low-impact read operation",
+    "risk_level": "low",
+    "reversible": True
+})
+
+
+def _delete_report(db_name: str, timestamp: str) -> Dict[str, Any]:
+    return {
+        **_DELETE_TEMPLATE,
+        "target": db_name,
+        "predicted_outcome": {
+            "data_recovery": "IMPOSSIBLE",
+            "service_impact": "CATASTROPHIC",
+            "user_impact": "TOTAL DATA LOSS"
+        },
+        "impact": {
+            "severity": "CRITICAL",
+            "data_loss": "PERMANENT AND IRREVERSIBLE",
+            "affected_systems": "All dependent services",
+            "recovery_time": "IMPOSSIBLE - no recovery",
+            "description": f"⚠️ PERMANENT deletion of '{db_name}' and ALL its data"
+        },
+        "timestamp": timestamp
+    }
+
+
+def _status_report(target: str, timestamp: str) -> Dict[str, Any]:
+    return {
+        **_STATUS_TEMPLATE,
+        "target": target,
+        "impact": {
+            "description": "Read-only operation - no system changes",
+            "affected_systems": "None",
+            "resource_usage": "Minimal API call"
+        },
+        "timestamp": timestamp
+    }
 
 
 class ImpactSimulator:
@@ -16,6 +127,16 @@ class ImpactSimulator:
     Generates human-readable impact reports before executing dangerous tools.
     """
     
+    def __init__(self):
+        # Tool name -> simulation; tools not listed get _simulate_default
+        self._dispatch = {
+            "restart_service": self._simulate_restart,
+            "scale_fleet": self._simulate_scale,
+            "delete_database": self._simulate_delete,
+            "get_service_status": self._simulate_status_check,
+            "read_logs": self._simulate_read_logs
+        }
+    
     def simulate(self, tool_name: str, args: Dict[str, Any], infra) -> Dict[str, Any]:
         """
         Simulate tool execution and predict impact.
@@ -28,30 +149,15 @@ class ImpactSimulator:
         Returns:
             Impact report with predictions
         """
-        
-        if tool_name == "restart_service":
-            return self._simulate_restart(args, infra)
-        
-        elif tool_name == "scale_fleet":
-            return self._simulate_scale(args, infra)
-        
-        elif tool_name == "delete_database":
-            return self._simulate_delete(args, infra)
-        
-        elif tool_name == "get_service_status":
-            return self._simulate_status_check(args, infra)
-        
-        elif tool_name == "read_logs":
-            return self._simulate_read_logs(args, infra)
-        
-        else:
-            return {
-                "action": tool_name,
-                "summary": "Low-impact read operation",
-                "risk_level": "low",
-                "reversible": True,
-                "timestamp": datetime.now().isoformat()
-            }
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
+            return self._simulate_default(tool_name)
+        return handler(args, infra)
+    
+    @staticmethod
+    def _simulate_default(tool_name: str) -> Dict[str, Any]:
+        """Fallback report for tools without a dedicated simulation."""
+        return {"action": tool_name, **_DEFAULT_TEMPLATE, "timestamp": _now_iso()}
     
     def _simulate_restart(self, args: Dict[str, Any], infra) -> Dict[str, Any]:
         """Simulate service restart impact."""
@@ -59,17 +165,9 @@ class ImpactSimulator:
         current_health = infra.services.get(service, "unknown")
         
         # Estimate impact based on service type
-        service_importance = {
-            "web-server": {"users": 5000, "revenue_per_minute": 1000},
-            "api-gateway": {"users": 3000, "revenue_per_minute": 800},
-            "database": {"users": 10000, "revenue_per_minute": 2000},
-            "cache": {"users": 2000, "revenue_per_minute": 300},
-            "load-balancer": {"users": 8000, "revenue_per_minute": 1500}
-        }
+        impact_data = SERVICE_IMPORTANCE.get(service, _DEFAULT_IMPORTANCE)
         
-        impact_data = service_importance.get(service, {"users": 1000, "revenue_per_minute": 100})
-        
-        downtime_estimate = 15  # seconds
+        downtime_estimate = RESTART_DOWNTIME_SECONDS
         revenue_loss = (impact_data["revenue_per_minute"] / 60) * downtime_estimate
         
         return {
@@ -88,13 +186,9 @@ class ImpactSimulator:
             },
             "risk_level": "medium" if current_health != "healthy" else "low",
             "reversible": True,
-            "alternatives": [
-                "Check service logs first",
-                "Scale fleet to handle load",
-                "Monitor without intervention"
-            ] if current_health == "healthy" else [],
+            "alternatives": _RESTART_ALTERNATIVES_HEALTHY if current_health == "healthy" else (),
             "recommendation": "Proceed - service is unhealthy" if current_health != "healthy" else "Not recommended - service is healthy",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     
     def _simulate_scale(self, args: Dict[str, Any], infra) -> Dict[str, Any]:
@@ -103,9 +197,7 @@ class ImpactSimulator:
         target = args.get("count", current)
         delta = target - current
         
-        # Cost estimates (example: $0.10 per instance per hour)
-        hourly_cost_per_instance = 0.10
-        monthly_cost_delta = delta * hourly_cost_per_instance * 730  # 730 hours/month
+        monthly_cost_delta = delta * _MONTHLY_COST_PER_INSTANCE
         
         return {
             "action": "scale_fleet",
@@ -125,85 +217,30 @@ class ImpactSimulator:
             },
             "risk_level": "medium" if abs(delta) > 5 else "low",
             "reversible": True,
-            "alternatives": [
-                "Monitor current load first",
-                "Scale gradually in steps",
-                f"Set auto-scaling threshold instead"
-            ],
+            "alternatives": _SCALE_ALTERNATIVES,
             "recommendation": "Proceed with caution" if abs(delta) > 3 else "Safe to proceed",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     
     def _simulate_delete(self, args: Dict[str, Any], infra) -> Dict[str, Any]:
         """Simulate database deletion impact."""
-        db_name = args.get("db_name", "unknown")
-        
-        return {
-            "action": "delete_database",
-            "target": db_name,
-            "impact": {
-                "severity": "CRITICAL",
-                "data_loss": "PERMANENT AND IRREVERSIBLE",
-                "affected_systems": "All dependent services",
-                "recovery_time": "IMPOSSIBLE - no recovery",
-                "description": f"⚠️ PERMANENT deletion of '{db_name}' and ALL its data"
-            },
-            "predicted_outcome": {
-                "data_recovery": "IMPOSSIBLE",
-                "service_impact": "CATASTROPHIC",
-                "user_impact": "TOTAL DATA LOSS"
-            },
-            "risk_level": "CRITICAL",
-            "reversible": False,
-            "alternatives": [
-                "Archive old data instead of deleting",
-                "Scale up storage capacity",
-                "Create backup before any operation",
-                "Contact DBA for safe data cleanup",
-                "Use data retention policies"
-            ],
-            "recommendation": "❌ NEVER PROCEED - Use alternatives",
-            "warnings": [
-                "This action is ALWAYS BLOCKED by policy",
-                "No legitimate use case for this operation",
-                "Permanent data loss",
-                "Violates data retention requirements"
-            ],
-            "timestamp": datetime.now().isoformat()
-        }
+        return _delete_report(args.get("db_name", "unknown"), _now_iso())
     
     def _simulate_status_check(self, args: Dict[str, Any], infra) -> Dict[str, Any]:
         """Simulate status check (safe operation)."""
-        service = args.get("service_name")
-        
-        return {
-            "action": "get_service_status",
-            "target": service or "all services",
-            "impact": {
-                "description": "Read-only operation - no system changes",
-                "affected_systems": "None",
-                "resource_usage": "Minimal API call"
-            },
-            "risk_level": "none",
-            "reversible": True,
-            "recommendation": "✓ Safe to proceed - read-only operation",
-            "timestamp": datetime.now().isoformat()
-        }
+        return _status_report(args.get("service_name") or "all services", _now_iso())
     
     def _simulate_read_logs(self, args: Dict[str, Any], infra) -> Dict[str, Any]:
         """Simulate log reading (safe operation)."""
         lines = args.get("lines", 10)
         
         return {
-            "action": "read_logs",
+            **_READ_LOGS_TEMPLATE,
             "lines_requested": lines,
             "impact": {
                 "description": "Read-only log access - no system changes",
                 "data_exposed": f"Last {lines} log entries",
                 "resource_usage": "Minimal"
             },
-            "risk_level": "none",
-            "reversible": True,
-            "recommendation": "✓ Safe to proceed - read-only operation",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
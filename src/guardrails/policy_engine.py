@@ -7,22 +7,143 @@ Features:
 3. Cinderella Protocol: Time-bounded auto-expiring permissions
 """
 
-import json
+import os
 import time
+import heapq
+import atexit
+import logging
 import threading
-from typing import Dict, Any, List, Set, Optional, Callable
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, List, Set, Optional, Callable, Deque, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from ..log_queue import get_queued_logger
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _encode_record(record: Dict[str, Any]) -> bytes:
+        return orjson.dumps(record, default=_json_default, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:  # orjson is optional; fall back to stdlib json
+    import json
+
+    _json_loads = json.loads
+
+    def _encode_record(record: Dict[str, Any]) -> bytes:
+        return (json.dumps(record, default=_json_default, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode what plain JSON lacks: sets as lists, anything else as str()."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+# Per-call validate() chatter is DEBUG (LOG_LEVEL=DEBUG to see it)
+logger = get_queued_logger(__name__)
+
+# Bounded audit trail: oldest records fall off instead of growing forever
+EXECUTION_HISTORY_LIMIT = 10_000
+
+# Batched hand-off to an optional persistent audit sink
+AUDIT_FLUSH_BATCH = 256
+AUDIT_FLUSH_INTERVAL = 1.0
+# Pending records beyond this are dropped (and counted) if the sink falls behind
+AUDIT_PENDING_LIMIT = 10_000
+
+# Distinct (state, mode, tool, service) decisions kept by validate()
+DECISION_CACHE_SIZE = 512
+
+# Tools that change system state and must name a target service (SCALPEL)
+_MODIFICATION_TOOLS = frozenset({'restart_service', 'scale_fleet', 'delete_database'})
+
 
 class PolicyViolationError(Exception):
     """Raised when an action violates security policy."""
     
-    def __init__(self, message: str, tool_name: str, mode: str, reason: str):
+    def __init__(self, message: str, tool_name: str, mode: str, reason: str, *message_args: Any):
         self.tool_name = tool_name
         self.mode = mode
         self.reason = reason
+        # Optional %-style args, only formatted when the error is rendered
+        self._message_args = message_args
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        message = self.args[0]
+        if not self._message_args:
+            return message
+        return message % tuple(
+            list(arg) if isinstance(arg, (set, frozenset)) else arg
+            for arg in self._message_args
+        )
+
+
+class JsonlAuditSink:
+    """
+    Audit sink appending records to a JSON-lines file.
+    
+    Each batch is encoded up front and written with one write() and one
+    fsync(), so durability costs one sync per batch rather than per record.
+    """
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+    
+    def __call__(self, batch: List[Dict[str, Any]]) -> None:
+        data = b"".join(_encode_record(record) for record in batch)
+        with open(self.path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class _ExpiryScheduler:
+    """
+    One daemon thread firing callbacks at monotonic deadlines (heapq-ordered).
+    
+    Replaces a threading.Timer (one OS thread) per grant/extend. Entries are
+    never cancelled; callbacks check their own token and ignore stale fires.
+    """
+    
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._thread: Optional[threading.Thread] = None
+    
+    def schedule(self, delay_seconds: float, callback: Callable[[], None]) -> None:
+        """Run callback once, delay_seconds from now."""
+        with self._cond:
+            self._seq += 1
+            heapq.heappush(self._heap, (time.monotonic() + delay_seconds, self._seq, callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cinderella-expiry",
+                                                daemon=True)
+                self._thread.start()
+            self._cond.notify()
+    
+    def _run(self) -> None:
+        heap = self._heap
+        while True:
+            with self._cond:
+                while not heap or heap[0][0] > time.monotonic():
+                    self._cond.wait(heap[0][0] - time.monotonic() if heap else None)
+                _, _, callback = heapq.heappop(heap)
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️  CINDERELLA: expiry callback failed: {e}")
+
+
+_expiry_scheduler = _ExpiryScheduler()
 
 
 class TemporaryPermissionManager:
@@ -32,35 +153,50 @@ class TemporaryPermissionManager:
     """
     
     def __init__(self):
-        self.is_active = False
-        self.expiry_time: Optional[datetime] = None
-        self.timer: Optional[threading.Timer] = None
+        # (active, expiry on the monotonic clock, wall-clock expiry for display).
+        # Writers replace the whole tuple under self.lock; readers take one
+        # reference snapshot without locking.
+        self._state: Tuple[bool, float, Optional[datetime]] = (False, 0.0, None)
+        # Bumped by every grant/extend/revoke; an expiry only applies if its
+        # token is still current
+        self._token = 0
         self.lock = threading.Lock()
         self.on_expiry_callback: Optional[Callable] = None
+    
+    @property
+    def is_active(self) -> bool:
+        return self._state[0]
+    
+    @property
+    def expiry_time(self) -> Optional[datetime]:
+        return self._state[2]
+    
+    def _set_expiry(self, duration_seconds: float) -> None:
+        """Publish a new active state and schedule its expiry (caller holds lock)."""
+        self._token += 1
+        self._state = (
+            True,
+            time.monotonic() + duration_seconds,
+            datetime.now() + timedelta(seconds=duration_seconds)
+        )
+        token = self._token
+        _expiry_scheduler.schedule(duration_seconds, lambda: self._expire(token))
         
     def grant(self, duration_seconds: int, on_expiry: Optional[Callable] = None) -> None:
         """Grant temporary EMERGENCY permission."""
         with self.lock:
-            if self.timer:
-                self.timer.cancel()
-            
-            self.is_active = True
-            self.expiry_time = datetime.now() + timedelta(seconds=duration_seconds)
             self.on_expiry_callback = on_expiry
-            
-            self.timer = threading.Timer(duration_seconds, self._expire)
-            self.timer.daemon = True
-            self.timer.start()
+            self._set_expiry(duration_seconds)
             
             print(f"\n⏰ CINDERELLA: Temporary permission granted for {duration_seconds}s")
             print(f"   Expires at: {self.expiry_time.strftime('%H:%M:%S')}")
     
-    def _expire(self) -> None:
-        """Auto-expire permissions."""
+    def _expire(self, token: int) -> None:
+        """Auto-expire permissions (no-op if extended or revoked since scheduling)."""
         with self.lock:
-            self.is_active = False
-            self.expiry_time = None
-            self.timer = None
+            if token != self._token:
+                return
+            self._state = (False, 0.0, None)
             
             print(f"\n🕛 CINDERELLA: Permission expired - reverted to base mode")
             
@@ -70,29 +206,21 @@ class TemporaryPermissionManager:
     def revoke(self) -> None:
         """Manually revoke permissions."""
         with self.lock:
-            if self.timer:
-                self.timer.cancel()
-                self.timer = None
-            
-            self.is_active = False
-            self.expiry_time = None
+            self._token += 1
+            self._state = (False, 0.0, None)
             print(f"\n🛑 CINDERELLA: Permission manually revoked")
     
     def is_valid(self) -> bool:
-        """Check if permission is still valid."""
-        with self.lock:
-            return self.is_active and (
-                self.expiry_time is None or datetime.now() < self.expiry_time
-            )
+        """Check if permission is still valid (lock-free)."""
+        active, expiry, _ = self._state
+        return active and (expiry == 0.0 or time.monotonic() < expiry)
     
     def remaining_time(self) -> Optional[float]:
-        """Get remaining time in seconds."""
-        with self.lock:
-            if not self.is_active or self.expiry_time is None:
-                return None
-            
-            remaining = (self.expiry_time - datetime.now()).total_seconds()
-            return max(0, remaining)
+        """Get remaining time in seconds (lock-free)."""
+        active, expiry, _ = self._state
+        if not active or expiry == 0.0:
+            return None
+        return max(0, expiry - time.monotonic())
     
     def extend(self, additional_seconds: int) -> None:
         """Extend current permission."""
@@ -103,13 +231,7 @@ class TemporaryPermissionManager:
             remaining = self.remaining_time() or 0
             new_duration = int(remaining + additional_seconds)
             
-            if self.timer:
-                self.timer.cancel()
-            
-            self.expiry_time = datetime.now() + timedelta(seconds=new_duration)
-            self.timer = threading.Timer(new_duration, self._expire)
-            self.timer.daemon = True
-            self.timer.start()
+            self._set_expiry(new_duration)
             
             print(f"\n⏰ CINDERELLA: Extended by {additional_seconds}s (total: {new_duration}s)")
 
@@ -123,9 +245,11 @@ class PolicyEngine:
     3. CINDERELLA: Time-bounded auto-expiring permissions
     """
     
-    def __init__(self, policy_path: str):
+    def __init__(self, policy_path: str,
+                 audit_sink: Optional[Callable[[List[Dict[str, Any]]], None]] = None):
         self.policy_path = Path(policy_path)
         self.policy = self._load_policy()
+        self._build_lookups()
         self.current_mode = "NORMAL"
         self.base_mode = "NORMAL"
         
@@ -136,23 +260,75 @@ class PolicyEngine:
         # CINDERELLA: Time-bounded permissions
         self.temp_permission = TemporaryPermissionManager()
         
-        # SHADOW: Execution history for traceability
-        self.execution_history: List[Dict[str, Any]] = []
+        # Bumped by every mutator of mode/scope/unhealthy/permission state; lets
+        # derived views (status summary) be reused until something changes
+        self._state_version = 0
+        self._summary_cache: Optional[Tuple[Tuple[int, Optional[str]], str]] = None
+        # Memoized policy decisions keyed by (state_version, mode, tool, service);
+        # a state change bumps the version, so stale entries are never hit
+        self._cached_decision = lru_cache(maxsize=DECISION_CACHE_SIZE)(self._decide)
+        
+        # SHADOW: Execution history for traceability (ring buffer)
+        self.execution_history: Deque[Dict[str, Any]] = deque(maxlen=EXECUTION_HISTORY_LIMIT)
+        
+        # Optional persistence: records are queued and written in batches
+        # by one background thread (every AUDIT_FLUSH_INTERVAL seconds or
+        # as soon as AUDIT_FLUSH_BATCH records are pending)
+        self._audit_sink = audit_sink
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self.audit_dropped = 0
+        self._flush_event = threading.Event()
+        # The flush thread and the atexit flush can overlap; one drains at a time
+        # (this also keeps their sink writes from interleaving)
+        self._flush_lock = threading.Lock()
+        if audit_sink is not None:
+            threading.Thread(target=self._audit_flush_loop, name="policy-audit-flush",
+                             daemon=True).start()
+            atexit.register(self.flush_audit)
         
     def _load_policy(self) -> Dict[str, Any]:
         """Load policy configuration."""
         if not self.policy_path.exists():
             raise FileNotFoundError(f"Policy file not found: {self.policy_path}")
         
-        with open(self.policy_path, 'r') as f:
-            policy = json.load(f)
+        policy = _json_loads(self.policy_path.read_bytes())
         
         print(f"✓ Loaded policy: {policy.get('policy_name', 'Unknown')} v{policy.get('version', '?')}")
         return policy
     
+    def _build_lookups(self) -> None:
+        """
+        Hash-based views of the policy for validate(). self.policy keeps the
+        JSON lists (ordered, for reporting); membership checks use these.
+        """
+        self._always_blocked = frozenset(self.policy['global_rules']['always_blocked'])
+        self._mode_cache: Dict[str, Dict[str, Any]] = {
+            name: {
+                **mode,
+                'allowed_tools': frozenset(mode['allowed_tools']),
+                'blocked_tools': frozenset(mode['blocked_tools'])
+            }
+            for name, mode in self.policy['modes'].items()
+        }
+        # Ordered, immutable tool lists per mode for the reporting getters
+        self._tool_lists: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+            name: (tuple(mode['allowed_tools']), tuple(mode['blocked_tools']))
+            for name, mode in self.policy['modes'].items()
+        }
+        # (mode, tool) pairs that always pass: whitelisted, not blocked and not
+        # state-changing, so no SCALPEL check applies
+        self._allowed_read_pairs = frozenset(
+            (name, tool)
+            for name, mode in self._mode_cache.items()
+            for tool in mode['allowed_tools']
+            if tool not in mode['blocked_tools']
+            and tool not in self._always_blocked
+            and tool not in _MODIFICATION_TOOLS
+        )
+    
     def set_mode(self, mode: str) -> None:
         """Change operational mode permanently."""
-        if mode not in self.policy['modes']:
+        if mode not in self._mode_cache:
             raise ValueError(f"Invalid mode: {mode}")
         
         if self.temp_permission.is_valid():
@@ -160,22 +336,63 @@ class PolicyEngine:
         
         self.current_mode = mode
         self.base_mode = mode
+        self._state_version += 1
         print(f"\n🔄 Mode changed to: {mode}")
     
+    # ==================== AUDIT TRAIL ====================
+    
+    def _record(self, record: Dict[str, Any]) -> None:
+        """Append to the in-memory history and queue for the audit sink."""
+        self.execution_history.append(record)
+        if self._audit_sink is not None:
+            pending = len(self._pending)
+            if pending >= AUDIT_PENDING_LIMIT:
+                # Never block validation on a slow sink
+                self.audit_dropped += 1
+                return
+            self._pending.append(record)
+            if pending + 1 >= AUDIT_FLUSH_BATCH:
+                self._flush_event.set()
+    
+    def _audit_flush_loop(self) -> None:
+        """Background writer: drain pending records to the sink in batches."""
+        while True:
+            self._flush_event.wait(AUDIT_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            self.flush_audit()
+    
+    def flush_audit(self) -> None:
+        """Write all pending audit records to the sink in one batch."""
+        if self._audit_sink is None or not self._pending:
+            return
+        with self._flush_lock:
+            batch = []
+            pending = self._pending
+            while pending:
+                batch.append(pending.popleft())
+            if not batch:
+                return
+            try:
+                self._audit_sink(batch)
+            except Exception as e:
+                print(f"⚠️  Audit sink failed for {len(batch)} records: {e}")
+    
     # ==================== CINDERELLA PROTOCOL ====================
     
     def grant_temporary_emergency(self, duration_seconds: int = 10, reason: str = "") -> None:
         """CINDERELLA: Grant time-bounded emergency access."""
         self.base_mode = self.current_mode
         self.current_mode = "EMERGENCY"
+        self._state_version += 1
         
         def on_expiry():
             self.current_mode = self.base_mode
             self.incident_scope = {}  # Clear incident scope
+            self._state_version += 1
         
         self.temp_permission.grant(duration_seconds, on_expiry)
         
-        self.execution_history.append({
+        self._record({
             "timestamp": datetime.now().isoformat(),
             "action": "grant_temporary_emergency",
             "duration": duration_seconds,
@@ -188,8 +405,9 @@ class PolicyEngine:
             raise ValueError("No active temporary permission to extend")
         
         self.temp_permission.extend(additional_seconds)
+        self._state_version += 1  # new expiry_time; drop status caches
         
-        self.execution_history.append({
+        self._record({
             "timestamp": datetime.now().isoformat(),
             "action": "extend_temporary_emergency",
             "additional_seconds": additional_seconds
@@ -200,15 +418,19 @@ class PolicyEngine:
         self.temp_permission.revoke()
         self.current_mode = self.base_mode
         self.incident_scope = {}
+        self._state_version += 1
     
     def get_temporary_status(self) -> Dict[str, Any]:
         """Get CINDERELLA protocol status."""
+        permission = self.temp_permission
+        remaining = permission.remaining_time()
+        expiry_time = permission.expiry_time
         return {
-            "is_active": self.temp_permission.is_valid(),
-            "remaining_seconds": self.temp_permission.remaining_time(),
+            "is_active": bool(remaining),
+            "remaining_seconds": remaining,
             "base_mode": self.base_mode,
             "current_mode": self.current_mode,
-            "expiry_time": self.temp_permission.expiry_time.isoformat() if self.temp_permission.expiry_time else None
+            "expiry_time": expiry_time.isoformat() if expiry_time else None
         }
     
     # ==================== SCALPEL PROTOCOL ====================
@@ -218,26 +440,29 @@ class PolicyEngine:
         SCALPEL: Define scope of current incident.
         Only these specific services can be modified.
         """
+        now_iso = datetime.now().isoformat()
+        # Frozen so the scope and its audit record can share one object
+        affected = frozenset(affected_services)
         self.incident_scope = {
-            "affected_services": set(affected_services),
+            "affected_services": affected,
             "incident_type": incident_type,
             "reason": reason,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
         # Register as unhealthy
-        for service in affected_services:
-            self.unhealthy_services.add(service)
+        self.unhealthy_services |= affected
+        self._state_version += 1
         
         print(f"\n🎯 SCALPEL: Incident scope locked")
         print(f"   Affected services: {', '.join(affected_services)}")
         print(f"   Type: {incident_type}")
         print(f"   Reason: {reason}")
         
-        self.execution_history.append({
-            "timestamp": datetime.now().isoformat(),
+        self._record({
+            "timestamp": now_iso,
             "action": "set_incident_scope",
-            "affected_services": affected_services,
+            "affected_services": affected,
             "incident_type": incident_type,
             "reason": reason
         })
@@ -245,16 +470,19 @@ class PolicyEngine:
     def clear_incident_scope(self) -> None:
         """SCALPEL: Clear incident scope."""
         self.incident_scope = {}
+        self._state_version += 1
         print("\n🎯 SCALPEL: Incident scope cleared")
     
     def register_unhealthy_service(self, service_name: str) -> None:
         """SCALPEL: Mark service as unhealthy."""
         self.unhealthy_services.add(service_name)
+        self._state_version += 1
         print(f"⚠️  SCALPEL: Registered unhealthy - {service_name}")
     
     def mark_service_healthy(self, service_name: str) -> None:
         """SCALPEL: Mark service as recovered."""
         self.unhealthy_services.discard(service_name)
+        self._state_version += 1
         print(f"✓ SCALPEL: Service healthy - {service_name}")
     
     # ==================== VALIDATION ====================
@@ -271,149 +499,162 @@ class PolicyEngine:
             shadow_mode: If True, this is a simulation (SHADOW protocol)
         """
         args = args or {}
-        context = context or {}
-        
-        # Record validation attempt
-        validation_record = {
-            "timestamp": datetime.now().isoformat(),
-            "tool_name": tool_name,
-            "args": args,
-            "mode": self.current_mode,
-            "shadow_mode": shadow_mode
-        }
+        mode = self.current_mode
+        
+        # Every branch sets `result`; the record is appended exactly once
+        result = "ERROR"
+        try:
+            # Fast path: whitelisted read-only tools need no further checks
+            if (mode, tool_name) in self._allowed_read_pairs:
+                result = "ALLOWED"
+            else:
+                service_name = args.get('service_name')
+                try:
+                    result, error_args = self._cached_decision(
+                        self._state_version, mode, tool_name, service_name
+                    )
+                except TypeError:  # unhashable service_name; evaluate uncached
+                    result, error_args = self._decide(
+                        self._state_version, mode, tool_name, service_name
+                    )
+                if error_args is not None:
+                    raise PolicyViolationError(*error_args)
+        finally:
+            # Record the attempt; built once, complete, straight into history
+            self._record({
+                "timestamp": datetime.now().isoformat(),
+                "tool_name": tool_name,
+                "args": args,
+                "mode": mode,
+                "shadow_mode": shadow_mode,
+                "result": result
+            })
+        
+        # Show active protocol status (skipped entirely unless DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            # remaining_time() is None/0 exactly when the permission is not valid
+            remaining = self.temp_permission.remaining_time()
+            if remaining:
+                logger.debug("  ⏰ CINDERELLA: %.1fs remaining", remaining)
+            
+            if self.incident_scope:
+                logger.debug("  🎯 SCALPEL: Scope - %s", list(self.incident_scope.get('affected_services', [])))
+            
+            if shadow_mode:
+                logger.debug("  🔮 SHADOW: Simulation mode - no real execution")
+            
+            logger.debug("  ✓ Policy OK: %s for %s", tool_name, args.get('service_name', 'N/A'))
+        return True
+    
+    def _decide(self, state_version: int, mode: str, tool_name: str,
+                service_name: Any) -> Tuple[str, Optional[tuple]]:
+        """
+        Policy decision for one (mode, tool, service) under the current state.
         
+        Returns (result, None) when allowed, else (result, PolicyViolationError
+        args). Pure given state_version, which is why it can be memoized.
+        """
         # Check global blocks
-        if tool_name in self.policy['global_rules']['always_blocked']:
-            validation_record["result"] = "BLOCKED_GLOBAL"
-            self.execution_history.append(validation_record)
-            
-            raise PolicyViolationError(
+        if tool_name in self._always_blocked:
+            return "BLOCKED_GLOBAL", (
                 f"'{tool_name}' is globally blocked - destructive operation",
-                tool_name=tool_name,
-                mode=self.current_mode,
-                reason="Globally blocked"
+                tool_name, mode, "Globally blocked"
             )
         
-        mode_policy = self.policy['modes'][self.current_mode]
+        mode_policy = self._mode_cache[mode]
         
         # Check mode-level blocks
         if tool_name in mode_policy['blocked_tools']:
-            validation_record["result"] = "BLOCKED_MODE"
-            self.execution_history.append(validation_record)
-            
-            raise PolicyViolationError(
-                f"'{tool_name}' blocked in {self.current_mode} mode",
-                tool_name=tool_name,
-                mode=self.current_mode,
-                reason=mode_policy.get('rationale', 'Blocked in current mode')
+            return "BLOCKED_MODE", (
+                f"'{tool_name}' blocked in {mode} mode",
+                tool_name, mode, mode_policy.get('rationale', 'Blocked in current mode')
             )
         
         # Check whitelist
         if tool_name not in mode_policy['allowed_tools']:
-            validation_record["result"] = "NOT_WHITELISTED"
-            self.execution_history.append(validation_record)
-            
-            raise PolicyViolationError(
-                f"'{tool_name}' not whitelisted for {self.current_mode} mode",
-                tool_name=tool_name,
-                mode=self.current_mode,
-                reason="Not in allowed tools"
+            return "NOT_WHITELISTED", (
+                f"'{tool_name}' not whitelisted for {mode} mode",
+                tool_name, mode, "Not in allowed tools"
             )
         
         # SCALPEL PROTOCOL: Check service-specific constraints
-        if self._is_modification_tool(tool_name):
-            service_name = args.get('service_name')
-            
+        if tool_name in _MODIFICATION_TOOLS:
             if not service_name:
-                validation_record["result"] = "MISSING_SERVICE"
-                self.execution_history.append(validation_record)
-                
-                raise PolicyViolationError(
+                return "MISSING_SERVICE", (
                     f"'{tool_name}' requires service_name parameter",
-                    tool_name=tool_name,
-                    mode=self.current_mode,
-                    reason="Missing service target"
+                    tool_name, mode, "Missing service target"
                 )
             
             # In EMERGENCY mode, check SCALPEL constraints
-            if self.current_mode == "EMERGENCY":
+            if mode == "EMERGENCY":
                 restrictions = mode_policy.get('service_restrictions', {})
                 
                 if restrictions.get('enabled', False):
                     # Check if service is unhealthy
                     if service_name not in self.unhealthy_services:
-                        validation_record["result"] = "SERVICE_HEALTHY"
-                        self.execution_history.append(validation_record)
-                        
-                        raise PolicyViolationError(
-                            f"SCALPEL: Cannot modify '{service_name}' - service is healthy. "
-                            f"Only unhealthy services can be modified: {list(self.unhealthy_services)}",
-                            tool_name=tool_name,
-                            mode=self.current_mode,
-                            reason="Service not unhealthy"
+                        return "SERVICE_HEALTHY", (
+                            "SCALPEL: Cannot modify '%s' - service is healthy. "
+                            "Only unhealthy services can be modified: %s",
+                            tool_name, mode, "Service not unhealthy",
+                            service_name, frozenset(self.unhealthy_services)
                         )
                     
                     # Check incident scope if defined
                     if self.incident_scope:
-                        affected = self.incident_scope.get('affected_services', set())
+                        affected = self.incident_scope.get('affected_services', frozenset())
                         if service_name not in affected:
-                            validation_record["result"] = "OUT_OF_SCOPE"
-                            self.execution_history.append(validation_record)
-                            
-                            raise PolicyViolationError(
-                                f"SCALPEL: '{service_name}' is out of incident scope. "
-                                f"Current incident affects: {list(affected)}",
-                                tool_name=tool_name,
-                                mode=self.current_mode,
-                                reason="Service not in incident scope"
+                            return "OUT_OF_SCOPE", (
+                                "SCALPEL: '%s' is out of incident scope. "
+                                "Current incident affects: %s",
+                                tool_name, mode, "Service not in incident scope",
+                                service_name, affected
                             )
         
-        # Validation passed
-        validation_record["result"] = "ALLOWED"
-        self.execution_history.append(validation_record)
-        
-        # Show active protocol status
-        if self.temp_permission.is_valid():
-            remaining = self.temp_permission.remaining_time()
-            print(f"  ⏰ CINDERELLA: {remaining:.1f}s remaining")
-        
-        if self.incident_scope:
-            print(f"  🎯 SCALPEL: Scope - {list(self.incident_scope.get('affected_services', []))}")
-        
-        if shadow_mode:
-            print(f"  🔮 SHADOW: Simulation mode - no real execution")
-        
-        print(f"  ✓ Policy OK: {tool_name} for {args.get('service_name', 'N/A')}")
-        return True
+        return "ALLOWED", None
     
     def _is_modification_tool(self, tool_name: str) -> bool:
         """Check if tool modifies system state."""
-        modification_tools = ['restart_service', 'scale_fleet', 'delete_database']
-        return tool_name in modification_tools
+        return tool_name in _MODIFICATION_TOOLS
     
     # ==================== STATUS & REPORTING ====================
     
+    @property
+    def state_version(self) -> int:
+        """Counter bumped on every policy state change (read-only; use as a cache key)."""
+        return self._state_version
+    
     def get_current_mode(self) -> str:
         return self.current_mode
     
-    def get_allowed_tools(self) -> List[str]:
-        return self.policy['modes'][self.current_mode]['allowed_tools']
+    def get_allowed_tools(self) -> Tuple[str, ...]:
+        return self._tool_lists[self.current_mode][0]
     
-    def get_blocked_tools(self) -> List[str]:
-        return self.policy['modes'][self.current_mode]['blocked_tools']
+    def get_blocked_tools(self) -> Tuple[str, ...]:
+        return self._tool_lists[self.current_mode][1]
     
     def get_execution_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent execution history for traceability."""
-        return self.execution_history[-limit:]
+        if limit <= 0:
+            # Same as the old list slice [-limit:]: limit=0 returns the whole history
+            return list(islice(self.execution_history, -limit, None))
+        # Walk back from the newest end: O(limit), independent of history size
+        tail = list(islice(reversed(self.execution_history), limit))
+        tail.reverse()
+        return tail
     
     def get_policy_summary(self) -> str:
-        """Human-readable policy status."""
+        """Human-readable policy status (rebuilt only when state has changed)."""
+        remaining = self.temp_permission.remaining_time()
+        remaining_text = f"{remaining:.1f}" if remaining else None
+        key = (self._state_version, remaining_text)
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return self._summary_cache[1]
+        
         mode_info = self.policy['modes'][self.current_mode]
         
         temp_info = ""
-        if self.temp_permission.is_valid():
-            remaining = self.temp_permission.remaining_time()
-            temp_info = f"\n║  ⏰ CINDERELLA: {remaining:.1f}s remaining                    ║"
+        if remaining_text:
+            temp_info = f"\n║  ⏰ CINDERELLA: {remaining_text}s remaining                    ║"
         
         scope_info = ""
         if self.incident_scope:
@@ -424,7 +665,7 @@ class PolicyEngine:
         if self.unhealthy_services:
             unhealthy_info = f"\n║  ⚠️  Unhealthy: {', '.join(list(self.unhealthy_services)[:3]):<42}║"
         
-        return f"""
+        summary = f"""
 ╔════════════════════════════════════════════════════════════╗
 ║  UNIFIED POLICY ENGINE STATUS                              ║
 ╠════════════════════════════════════════════════════════════╣
@@ -434,3 +675,5 @@ class PolicyEngine:
 ║  {mode_info['description']:<57}║
 ╚════════════════════════════════════════════════════════════╝
 """
+        self._summary_cache = (key, summary)
+        return summary
@@ -0,0 +1,49 @@
+"""
+Queue-backed logging shared by the Proxi packages.
+
+Loggers hand records to one queue; a single listener thread does the
+stdout writes, so request-serving code never blocks on the stdout lock.
+"""
+
+import os
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+import threading
+from typing import Optional
+
+_setup_lock = threading.Lock()
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def _level_from_env() -> int:
+    """LOG_LEVEL as a logging level; unknown names fall back to INFO."""
+    level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+def _shared_queue_handler() -> logging.handlers.QueueHandler:
+    """Start the listener thread on first use and return the handler feeding it."""
+    global _queue_handler
+    with _setup_lock:
+        if _queue_handler is None:
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(
+                log_queue, logging.StreamHandler(sys.stdout), respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            _queue_handler = logging.handlers.QueueHandler(log_queue)
+        return _queue_handler
+
+
+def get_queued_logger(name: str) -> logging.Logger:
+    """Logger for `name` routed through the shared queue, at LOG_LEVEL."""
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.addHandler(_shared_queue_handler())
+        logger.setLevel(_level_from_env())
+        logger.propagate = False
+    return logger
@@ -5,51 +5,167 @@ Unified MCP Server with Three Protocols:
 3. CINDERELLA: Time-bounded permissions
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.routing import APIRoute
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
-import sys
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, BeforeValidator, Field, field_validator
+from typing import Dict, Any, Optional, List, Tuple, Callable, Literal
+from typing_extensions import Annotated, NotRequired, TypedDict
+import os
+import time
+import hashlib
+from datetime import datetime
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.guardrails.policy_engine import PolicyEngine, PolicyViolationError
+from src.guardrails.policy_engine import PolicyEngine, PolicyViolationError, JsonlAuditSink
 from src.guardrails.impact_simulator import ImpactSimulator
-from src.mcp_server.tools import (
-    cloud_infra, get_service_status, list_services,
-    read_logs, restart_service, scale_fleet, delete_database
-)
+from src.mcp_server.tools import cloud_infra, UNHEALTHY_STATES
+
+def _json_default(obj: Any) -> Any:
+    """Encode what plain JSON lacks (policy state uses sets/frozensets)."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+try:
+    import orjson
+    _DefaultResponse = ORJSONResponse
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default)
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; keep FastAPI's stdlib JSONResponse
+    import json
+    _DefaultResponse = JSONResponse
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+
+def _raw_json(content: bytes) -> Response:
+    """Return already-encoded JSON as-is (skips jsonable_encoder and re-encoding)."""
+    return Response(content=content, media_type="application/json")
+
+
+class _FastJSONRequest(Request):
+    """Request that decodes its JSON body with orjson when available."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = _loads(await self.body())
+        return self._json
+
+
+class _FastJSONRoute(APIRoute):
+    """Route that hands FastAPI's body parsing a _FastJSONRequest."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(_FastJSONRequest(request.scope, request.receive))
+
+        return route_handler
 
 # Initialize app
 app = FastAPI(
     title="Proxi Unified Guardian",
     description="AI Agent with SCALPEL, SHADOW, and CINDERELLA protocols",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=_DefaultResponse
 )
+# Must be set before any route is declared; only worth it when orjson is present
+if _DefaultResponse is ORJSONResponse:
+    app.router.route_class = _FastJSONRoute
 
 # CORS
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "OPTIONS"),
+    allow_headers=("Content-Type", "Authorization", "If-None-Match"),
+    expose_headers=("ETag",),
 )
 
+# Compress larger JSON payloads (logs, history, catalog); small acks stay uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Initialize components
-policy_path = Path(__file__).parent.parent.parent / "policies" / "ops_policy.json"
-policy_engine = PolicyEngine(str(policy_path))
+policy_path = Path(__file__).parents[2] / "policies" / "ops_policy.json"
+# Optional durable audit trail (JSON lines, batched writes)
+audit_log_path = os.environ.get("PROXI_AUDIT_LOG")
+policy_engine = PolicyEngine(
+    str(policy_path),
+    audit_sink=JsonlAuditSink(audit_log_path) if audit_log_path else None
+)
 impact_simulator = ImpactSimulator()
 
 
+# ==================== RESPONSE CACHE ====================
+
+# Read-heavy endpoints keep their last encoded body for up to this long,
+# as long as the state key still matches
+RESPONSE_CACHE_TTL = 1.0
+
+# Bumped whenever cloud_infra changes (tool runs, simulated incidents);
+# policy changes are tracked by policy_engine's own state version
+_infra_generation = 0
+_response_cache: Dict[str, Tuple[tuple, float, bytes, str]] = {}
+
+
+def _bump_infra_generation() -> None:
+    global _infra_generation
+    _infra_generation += 1
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if the client's If-None-Match header lists `etag` (or is '*')."""
+    if not if_none_match:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+
+def _cached_json(name: str, key: tuple, build: Callable[[], bytes],
+                 if_none_match: Optional[str] = None) -> Response:
+    """Serve the cached body for `name` if `key` matches and it is fresh.
+    
+    Bodies carry an ETag; a matching If-None-Match gets an empty 304 instead.
+    """
+    now = time.monotonic()
+    entry = _response_cache.get(name)
+    if entry is not None and entry[0] == key and now - entry[1] < RESPONSE_CACHE_TTL:
+        content, etag = entry[2], entry[3]
+    else:
+        content = build()
+        etag = '"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+        _response_cache[name] = (key, now, content, etag)
+    
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+
 # ==================== REQUEST/RESPONSE MODELS ====================
 
 class ToolRequest(BaseModel):
     tool_name: str
     arguments: Dict[str, Any] = Field(default_factory=dict)
     context: Optional[Dict[str, Any]] = Field(default_factory=dict)
-    execution_mode: str = Field(default="REAL", description="REAL or SHADOW")
+    execution_mode: Literal["REAL", "SHADOW"] = Field(default="REAL", description="REAL or SHADOW")
+    
+    @field_validator("execution_mode", mode="before")
+    @classmethod
+    def _normalize_execution_mode(cls, value: Any) -> Any:
+        # Accept any casing ("shadow"); Literal then rejects anything else
+        return value.upper() if isinstance(value, str) else value
 
 class ToolResponse(BaseModel):
     success: bool
@@ -60,24 +176,46 @@ class ToolResponse(BaseModel):
     shadow_report: Optional[Dict[str, Any]] = None
     execution_flow: Optional[List[Dict[str, Any]]] = None
 
-class ModeChangeRequest(BaseModel):
-    mode: str
+# Modes come from the loaded policy file, so a mode added there is accepted here too
+POLICY_MODES: Tuple[str, ...] = tuple(policy_engine.policy['modes'])
+
+
+def _check_policy_mode(value: Any) -> Any:
+    if value not in POLICY_MODES:
+        raise ValueError(f"mode must be one of: {', '.join(POLICY_MODES)}")
+    return value
+
+
+# A plain str to type checkers; validated against POLICY_MODES at request time
+PolicyMode = Annotated[
+    str, BeforeValidator(_check_policy_mode), Field(json_schema_extra={"enum": list(POLICY_MODES)})
+]
+# Health states used by cloud_infra
+ServiceHealth = Literal["healthy", "degraded", "critical"]
+
+# Trivial bodies are TypedDicts: validated by pydantic-core, no model object built
+class ModeChangeRequest(TypedDict):
+    mode: PolicyMode
 
 class TemporaryPermissionRequest(BaseModel):
     duration_seconds: int = Field(default=10, ge=1, le=300)
     reason: str = Field(default="", description="Reason for emergency access")
 
-class TemporaryExtensionRequest(BaseModel):
-    additional_seconds: int = Field(default=10, ge=1, le=60)
+class TemporaryExtensionRequest(TypedDict):
+    additional_seconds: NotRequired[Annotated[int, Field(ge=1, le=60)]]  # default 10
 
 class IncidentScopeRequest(BaseModel):
     affected_services: List[str]
     incident_type: str
     reason: str
 
-class IncidentSimulation(BaseModel):
+class IncidentSimulation(TypedDict):
     service: str
-    status: str = Field(default="critical")
+    status: NotRequired[ServiceHealth]  # default "critical"
+
+class ScenarioPrepareRequest(BaseModel):
+    mode: PolicyMode
+    incidents: List[IncidentSimulation] = Field(default_factory=list)
 
 
 # ==================== CORE ENDPOINTS ====================
@@ -102,13 +240,20 @@ async def root():
     }
 
 
-@app.get("/policy/status")
-async def get_policy_status():
-    """Get comprehensive policy status."""
-    temp_status = policy_engine.get_temporary_status()
+@app.get("/healthz")
+async def healthz():
+    """Lightweight liveness probe (no policy or infrastructure lookups)."""
+    return {"status": "ok"}
+
+
+def _policy_status_body(temp_status: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble the /policy/status payload."""
     return {
         "current_mode": policy_engine.get_current_mode(),
         "base_mode": temp_status["base_mode"],
+        # Change whenever policy or infrastructure state does; clients key caches on them
+        "state_version": policy_engine.state_version,
+        "infra_state_version": cloud_infra.state_version,
         "allowed_tools": policy_engine.get_allowed_tools(),
         "blocked_tools": policy_engine.get_blocked_tools(),
         "protocols": {
@@ -126,20 +271,50 @@ async def get_policy_status():
     }
 
 
+@app.get("/policy/status")
+async def get_policy_status(request: Request):
+    """Get comprehensive policy status (supports If-None-Match)."""
+    temp_status = policy_engine.get_temporary_status()
+    return _cached_json(
+        "policy_status",
+        # remaining_seconds is left out of the key on purpose: while a permission is
+        # active it changes on every call, and RESPONSE_CACHE_TTL bounds its staleness
+        (policy_engine.state_version, cloud_infra.state_version),
+        lambda: _dumps(_policy_status_body(temp_status)),
+        request.headers.get("if-none-match")
+    )
+
+
 # ==================== MODE MANAGEMENT ====================
 
+# Fixed parts of the mutation acks, encoded once with the closing brace dropped
+# where per-call fields are appended
+_SET_MODE_ACKS = {
+    mode: _dumps({"success": True, "new_mode": mode})[:-1]
+    for mode in POLICY_MODES
+}
+_REVOKE_ACK = _dumps({
+    "success": True,
+    "protocol": "CINDERELLA",
+    "message": "Temporary permission revoked"
+})[:-1]
+_CLEAR_SCOPE_ACK = _dumps({
+    "success": True,
+    "protocol": "SCALPEL",
+    "message": "Incident scope cleared"
+})
+
+
 @app.post("/policy/set-mode")
 async def set_mode(request: ModeChangeRequest):
-    """Change operational mode."""
-    try:
-        policy_engine.set_mode(request.mode)
-        return {
-            "success": True,
-            "new_mode": request.mode,
-            "allowed_tools": policy_engine.get_allowed_tools()
-        }
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    """Change operational mode (the mode is validated by ModeChangeRequest)."""
+    mode = request["mode"]
+    policy_engine.set_mode(mode)
+    return _raw_json(b"".join((
+        _SET_MODE_ACKS[mode],
+        b',"allowed_tools":', _dumps(policy_engine.get_allowed_tools()),
+        b"}"
+    )))
 
 
 # ==================== CINDERELLA PROTOCOL ====================
@@ -170,16 +345,17 @@ async def grant_temporary_permission(request: TemporaryPermissionRequest):
 @app.post("/policy/extend-temporary")
 async def extend_temporary_permission(request: TemporaryExtensionRequest):
     """CINDERELLA: Extend current temporary permission."""
+    additional_seconds = request.get("additional_seconds", 10)
     try:
-        policy_engine.extend_temporary_emergency(request.additional_seconds)
+        policy_engine.extend_temporary_emergency(additional_seconds)
         
         new_status = policy_engine.get_temporary_status()
         
         return {
             "success": True,
             "protocol": "CINDERELLA",
-            "message": f"Permission extended by {request.additional_seconds}s",
-            "additional_seconds": request.additional_seconds,
+            "message": f"Permission extended by {additional_seconds}s",
+            "additional_seconds": additional_seconds,
             "total_remaining_seconds": new_status["remaining_seconds"],
             "expiry_time": new_status["expiry_time"]
         }
@@ -195,12 +371,11 @@ async def revoke_temporary_permission():
     try:
         policy_engine.revoke_temporary_emergency()
         
-        return {
-            "success": True,
-            "protocol": "CINDERELLA",
-            "message": "Temporary permission revoked",
-            "current_mode": policy_engine.get_current_mode()
-        }
+        return _raw_json(b"".join((
+            _REVOKE_ACK,
+            b',"current_mode":', _dumps(policy_engine.get_current_mode()),
+            b"}"
+        )))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -236,79 +411,101 @@ async def clear_incident_scope():
     try:
         policy_engine.clear_incident_scope()
         
-        return {
-            "success": True,
-            "protocol": "SCALPEL",
-            "message": "Incident scope cleared"
-        }
+        return _raw_json(_CLEAR_SCOPE_ACK)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # ==================== TOOL EXECUTION ====================
 
-@app.post("/tools/execute", response_model=ToolResponse)
-async def execute_tool(request: ToolRequest):
+# Always build execution_flow, even without ?trace (debugging aid)
+TRACE_EXECUTION_FLOW = os.environ.get("PROXI_TRACE_FLOW") == "1"
+
+
+class _ExecutionFlow:
+    """Per-request trace of timestamped steps, returned as execution_flow."""
+    __slots__ = ("steps",)
+    
+    def __init__(self):
+        self.steps: List[Dict[str, Any]] = []
+    
+    def add(self, name: str, **details: Any) -> None:
+        # Callers pass live sets; snapshot them here so untraced requests
+        # never pay for the copy
+        for key, value in details.items():
+            if isinstance(value, (set, frozenset)):
+                details[key] = list(value)
+        self.steps.append({"step": name, "timestamp": datetime.now().isoformat(), **details})
+
+
+class _NullFlow:
+    """Stand-in when tracing is off: records nothing, reports no steps."""
+    __slots__ = ()
+    steps = None
+    
+    def add(self, name: str, **details: Any) -> None:
+        pass
+
+
+_NULL_FLOW = _NullFlow()
+
+
+@app.post("/tools/execute", response_model=ToolResponse, response_model_exclude_none=True)
+async def execute_tool(request: ToolRequest, trace: bool = False):
     """
     Execute tool with all three protocols:
     - SCALPEL: Service-specific validation
     - SHADOW: Impact simulation
     - CINDERELLA: Time-bounded permissions
+    
+    Pass ?trace=true (or set PROXI_TRACE_FLOW=1) to get execution_flow back.
     """
     tool_name = request.tool_name
     arguments = request.arguments
     context = request.context
-    execution_mode = request.execution_mode.upper()
-    
-    # Execution flow tracking
-    execution_flow = []
-    execution_flow.append({
-        "step": "request_received",
-        "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-        "tool": tool_name,
-        "arguments": arguments,
-        "mode": execution_mode
-    })
+    execution_mode = request.execution_mode  # already normalized and validated
     
-    # Validate execution mode
-    if execution_mode not in {"REAL", "SHADOW"}:
-        raise HTTPException(status_code=400, detail="Invalid execution_mode. Use REAL or SHADOW.")
+    # Execution flow tracking (no-op unless requested)
+    flow = _ExecutionFlow() if trace or TRACE_EXECUTION_FLOW else _NULL_FLOW
+    flow.add(
+        "request_received",
+        tool=tool_name,
+        arguments=arguments,
+        mode=execution_mode
+    )
     
     # STEP 1: Handle status checks (updates unhealthy service tracking)
     if tool_name == "get_service_status":
         result = _execute_tool_function(tool_name, arguments)
         _update_unhealthy_services(arguments.get('service_name'), result)
         
-        execution_flow.append({
-            "step": "status_check_completed",
-            "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-            "unhealthy_services": list(policy_engine.unhealthy_services)
-        })
+        flow.add(
+            "status_check_completed",
+            unhealthy_services=policy_engine.unhealthy_services
+        )
         
-        return ToolResponse(
+        return _tool_response(
             success=True,
             result=result,
-            execution_flow=execution_flow
+            execution_flow=flow.steps
         )
     
     # STEP 2: SHADOW MODE - Impact simulation
     if execution_mode == "SHADOW":
-        execution_flow.append({
-            "step": "shadow_mode_simulation",
-            "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-            "message": "Generating impact report without execution"
-        })
+        flow.add(
+            "shadow_mode_simulation",
+            message="Generating impact report without execution"
+        )
         
         impact_report = impact_simulator.simulate(tool_name, arguments, cloud_infra)
         
-        execution_flow.append({
-            "step": "impact_report_generated",
-            "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-            "risk_level": impact_report.get("risk_level"),
-            "recommendation": impact_report.get("recommendation")
-        })
+        flow.add(
+            "impact_report_generated",
+            risk_level=impact_report.get("risk_level"),
+            recommendation=impact_report.get("recommendation")
+        )
         
-        return ToolResponse(
+        return _tool_response(
             success=True,
             result={
                 "mode": "SHADOW",
@@ -316,104 +513,116 @@ async def execute_tool(request: ToolRequest):
                 "note": "No real action executed - simulation only"
             },
             shadow_report=impact_report,
-            execution_flow=execution_flow
+            execution_flow=flow.steps
         )
     
     # STEP 3: Policy validation (SCALPEL + CINDERELLA)
-    execution_flow.append({
-        "step": "policy_validation_start",
-        "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-        "current_mode": policy_engine.get_current_mode(),
-        "unhealthy_services": list(policy_engine.unhealthy_services),
-        "incident_scope": policy_engine.incident_scope if policy_engine.incident_scope else None
-    })
+    flow.add(
+        "policy_validation_start",
+        current_mode=policy_engine.current_mode,
+        unhealthy_services=policy_engine.unhealthy_services,
+        incident_scope=policy_engine.incident_scope if policy_engine.incident_scope else None
+    )
     
     try:
         policy_engine.validate(tool_name, arguments, context, shadow_mode=False)
         
-        execution_flow.append({
-            "step": "policy_validation_passed",
-            "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-            "message": "All policy checks passed"
-        })
+        flow.add(
+            "policy_validation_passed",
+            message="All policy checks passed"
+        )
         
     except PolicyViolationError as e:
-        execution_flow.append({
-            "step": "policy_validation_failed",
-            "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-            "reason": e.reason,
-            "violation_type": str(type(e).__name__)
-        })
+        flow.add(
+            "policy_validation_failed",
+            reason=e.reason,
+            violation_type=str(type(e).__name__)
+        )
         
-        return ToolResponse(
+        return _tool_response(
             success=False,
             policy_violation=True,
             blocked_reason=str(e),
             error=f"Policy violation: {e.reason}",
-            execution_flow=execution_flow
+            execution_flow=flow.steps
         )
     
     # STEP 4: Execute tool
-    execution_flow.append({
-        "step": "tool_execution_start",
-        "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat()
-    })
+    flow.add("tool_execution_start")
     
     try:
         result = _execute_tool_function(tool_name, arguments)
         
-        execution_flow.append({
-            "step": "tool_execution_completed",
-            "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-            "result": str(result)[:200]  # Truncate for flow
-        })
+        flow.add(
+            "tool_execution_completed",
+            result=str(result)[:200]  # Truncate for flow
+        )
         
         # Update service health if restart succeeded
-        if tool_name == "restart_service" and "success" in str(result).lower():
+        if tool_name == "restart_service" and result.get("status") == "success":
             service_name = arguments.get('service_name')
             if service_name:
                 policy_engine.mark_service_healthy(service_name)
                 cloud_infra.set_service_health(service_name, "healthy")
                 
-                execution_flow.append({
-                    "step": "service_health_updated",
-                    "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-                    "service": service_name,
-                    "new_health": "healthy"
-                })
+                flow.add(
+                    "service_health_updated",
+                    service=service_name,
+                    new_health="healthy"
+                )
         
-        return ToolResponse(
+        return _tool_response(
             success=True,
             result=result,
-            execution_flow=execution_flow
+            execution_flow=flow.steps
         )
         
     except Exception as e:
-        execution_flow.append({
-            "step": "tool_execution_failed",
-            "timestamp": cloud_infra._log_action.__globals__['datetime'].now().isoformat(),
-            "error": str(e)
-        })
+        flow.add(
+            "tool_execution_failed",
+            error=str(e)
+        )
         
-        return ToolResponse(
+        return _tool_response(
             success=False,
             error=f"Execution error: {str(e)}",
-            execution_flow=execution_flow
+            execution_flow=flow.steps
         )
 
 
+def _tool_response(**fields: Any) -> Response:
+    """
+    Encode a ToolResponse body directly. The fields are built by this module,
+    so model_construct skips re-validation; returning a Response also makes
+    FastAPI skip response_model checking (the model still documents /docs).
+    Unset optional fields are omitted rather than sent as null.
+    """
+    return _raw_json(_dumps(
+        ToolResponse.model_construct(**fields).model_dump(exclude_none=True)
+    ))
+
+
 def _update_unhealthy_services(service_name: Optional[str], status_result: Any) -> None:
     """Update policy engine's unhealthy service tracking."""
     try:
         if service_name is None:
+            # Only touch services whose tracked state actually changes; services the
+            # engine tracks but the infrastructure does not know are left alone
+            tracked = policy_engine.unhealthy_services
+            unhealthy_now = set()
+            healthy_now = set()
             for svc_name, health in cloud_infra.services.items():
-                if health in ["critical", "degraded"]:
-                    policy_engine.register_unhealthy_service(svc_name)
+                if health in UNHEALTHY_STATES:
+                    unhealthy_now.add(svc_name)
                 elif health == "healthy":
-                    policy_engine.mark_service_healthy(svc_name)
+                    healthy_now.add(svc_name)
+            for svc_name in unhealthy_now - tracked:
+                policy_engine.register_unhealthy_service(svc_name)
+            for svc_name in healthy_now & tracked:
+                policy_engine.mark_service_healthy(svc_name)
         else:
             health = cloud_infra.services.get(service_name, "unknown")
-            if health in ["critical", "degraded"]:
+            if health in UNHEALTHY_STATES:
                 policy_engine.register_unhealthy_service(service_name)
             elif health == "healthy":
                 policy_engine.mark_service_healthy(service_name)
@@ -421,22 +630,27 @@ def _update_unhealthy_services(service_name: Optional[str], status_result: Any)
         print(f"Error updating unhealthy services: {e}")
 
 
-def _execute_tool_function(tool_name: str, arguments: Dict[str, Any]) -> Any:
+# Tool name -> infrastructure method, built once at import. The methods return
+# structured dicts, so callers can check fields instead of parsing strings, and
+# /tools/execute returns that dict as a JSON object in "result".
+_TOOL_MAP: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "get_service_status": cloud_infra.get_service_status,
+    "read_logs": cloud_infra.read_logs,
+    "restart_service": cloud_infra.restart_service,
+    "scale_fleet": cloud_infra.scale_fleet,
+    "delete_database": cloud_infra.delete_database,
+    "list_services": cloud_infra.list_services
+}
+
+
+def _execute_tool_function(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Route tool execution to appropriate function."""
-    tool_map = {
-        "get_service_status": get_service_status,
-        "read_logs": read_logs,
-        "restart_service": restart_service,
-        "scale_fleet": scale_fleet,
-        "delete_database": delete_database,
-        "list_services": list_services
-    }
-    
-    if tool_name not in tool_map:
+    tool_function = _TOOL_MAP.get(tool_name)
+    if tool_function is None:
         raise ValueError(f"Unknown tool: {tool_name}")
     
-    tool_function = tool_map[tool_name]
-    
+    # Every tool call at least logs an action on cloud_infra
+    _bump_infra_generation()
     try:
         result = tool_function(**arguments)
         return result
@@ -447,25 +661,31 @@ def _execute_tool_function(tool_name: str, arguments: Dict[str, Any]) -> Any:
 # ==================== INFRASTRUCTURE MANAGEMENT ====================
 
 @app.get("/infrastructure/status")
-async def get_infrastructure_status():
-    """Get infrastructure status."""
-    return {
-        "services": cloud_infra.services,
-        "fleet_size": cloud_infra.fleet_size,
-        "recent_actions": cloud_infra.execution_log[-10:],
-        "policy_unhealthy_services": list(policy_engine.unhealthy_services)
-    }
+async def get_infrastructure_status(request: Request):
+    """Get infrastructure status (supports If-None-Match)."""
+    return _cached_json(
+        "infrastructure",
+        (_infra_generation, policy_engine.state_version),
+        lambda: _dumps({
+            "services": cloud_infra.services,
+            "fleet_size": cloud_infra.fleet_size,
+            "recent_actions": cloud_infra.get_recent_actions(),
+            "policy_unhealthy_services": policy_engine.unhealthy_services
+        }),
+        request.headers.get("if-none-match")
+    )
 
 
 @app.post("/infrastructure/simulate-incident")
 async def simulate_incident(request: IncidentSimulation):
     """Simulate service incident."""
-    service = request.service
-    status = request.status
+    service = request["service"]
+    status = request.get("status", "critical")
     
     cloud_infra.set_service_health(service, status)
+    _bump_infra_generation()
     
-    if status in ["critical", "degraded"]:
+    if status in UNHEALTHY_STATES:
         policy_engine.register_unhealthy_service(service)
     else:
         policy_engine.mark_service_healthy(service)
@@ -478,12 +698,44 @@ async def simulate_incident(request: IncidentSimulation):
     }
 
 
+@app.post("/policy/prepare")
+async def prepare_scenario(request: ScenarioPrepareRequest):
+    """Apply a batch of simulated incidents and then switch mode, in one round trip."""
+    _bump_infra_generation()
+    updates = {
+        incident["service"]: incident.get("status", "critical")
+        for incident in request.incidents
+    }
+    cloud_infra.set_service_health_bulk(updates)
+    
+    for service, status in updates.items():
+        if status in UNHEALTHY_STATES:
+            policy_engine.register_unhealthy_service(service)
+        else:
+            policy_engine.mark_service_healthy(service)
+    
+    policy_engine.set_mode(request.mode)
+    
+    return {
+        "success": True,
+        "new_mode": request.mode,
+        "allowed_tools": policy_engine.get_allowed_tools(),
+        "infrastructure_status": {
+            incident["service"]: cloud_infra.services.get(incident["service"])
+            for incident in request.incidents
+        },
+        "policy_unhealthy_services": list(policy_engine.unhealthy_services)
+    }
+
+
 # ==================== HISTORY & TRACEABILITY ====================
 
 @app.get("/execution/history")
 async def get_execution_history(limit: int = 50):
     """Get execution history for traceability."""
-    return {
+    # The records are plain JSON data; encode them directly rather than
+    # letting jsonable_encoder walk every nested record first
+    return _raw_json(_dumps({
         "history": policy_engine.get_execution_history(limit),
         "total_events": len(policy_engine.execution_history),
         "protocols_active": {
@@ -491,56 +743,70 @@ async def get_execution_history(limit: int = 50):
             "cinderella": policy_engine.temp_permission.is_valid(),
             "shadow": True
         }
-    }
+    }))
+
+
+# Static part of the catalog, encoded once with the closing brace dropped so
+# the per-request fields can be appended as raw bytes
+_CATALOG_TOOLS_BYTES = _dumps({
+    "tools": [
+        {
+            "name": "list_services",
+            "description": "List all cloud services",
+            "category": "read-only",
+            "parameters": {}
+        },
+        {
+            "name": "get_service_status",
+            "description": "Get service health status",
+            "category": "read-only",
+            "parameters": {"service_name": "optional"}
+        },
+        {
+            "name": "read_logs",
+            "description": "Read system logs",
+            "category": "read-only",
+            "parameters": {"lines": "integer, default 10"}
+        },
+        {
+            "name": "restart_service",
+            "description": "Restart service (EMERGENCY only, unhealthy services only)",
+            "category": "active",
+            "parameters": {"service_name": "required"},
+            "restrictions": "SCALPEL: Only unhealthy services"
+        },
+        {
+            "name": "scale_fleet",
+            "description": "Scale fleet size (EMERGENCY only)",
+            "category": "active",
+            "parameters": {"count": "integer"}
+        },
+        {
+            "name": "delete_database",
+            "description": "Delete database (ALWAYS BLOCKED)",
+            "category": "destructive",
+            "parameters": {"db_name": "required"}
+        }
+    ]
+})[:-1]
 
 
 @app.get("/tools/catalog")
-async def get_tool_catalog():
-    """Get tool catalog with descriptions."""
-    return {
-        "tools": [
-            {
-                "name": "list_services",
-                "description": "List all cloud services",
-                "category": "read-only",
-                "parameters": {}
-            },
-            {
-                "name": "get_service_status",
-                "description": "Get service health status",
-                "category": "read-only",
-                "parameters": {"service_name": "optional"}
-            },
-            {
-                "name": "read_logs",
-                "description": "Read system logs",
-                "category": "read-only",
-                "parameters": {"lines": "integer, default 10"}
-            },
-            {
-                "name": "restart_service",
-                "description": "Restart service (EMERGENCY only, unhealthy services only)",
-                "category": "active",
-                "parameters": {"service_name": "required"},
-                "restrictions": "SCALPEL: Only unhealthy services"
-            },
-            {
-                "name": "scale_fleet",
-                "description": "Scale fleet size (EMERGENCY only)",
-                "category": "active",
-                "parameters": {"count": "integer"}
-            },
-            {
-                "name": "delete_database",
-                "description": "Delete database (ALWAYS BLOCKED)",
-                "category": "destructive",
-                "parameters": {"db_name": "required"}
-            }
-        ],
-        "current_mode": policy_engine.get_current_mode(),
-        "allowed_in_current_mode": policy_engine.get_allowed_tools(),
-        "unhealthy_services": list(policy_engine.unhealthy_services)
-    }
+async def get_tool_catalog(request: Request):
+    """Get tool catalog with descriptions (supports If-None-Match)."""
+    mode = policy_engine.get_current_mode()
+    return _cached_json(
+        "catalog",
+        (policy_engine.state_version, mode),
+        lambda: b"".join((
+            _CATALOG_TOOLS_BYTES,
+            b',"current_mode":', _dumps(mode),
+            b',"allowed_in_current_mode":', _dumps(policy_engine.get_allowed_tools()),
+            b',"unhealthy_services":', _dumps(policy_engine.unhealthy_services),
+            b"}"
+        )),
+        request.headers.get("if-none-match")
+    )
 
 
 if __name__ == "__main__":
@@ -554,4 +820,6 @@ if __name__ == "__main__":
     print("API Docs: http://localhost:8000/docs")
     print("="*70 + "\n")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Single worker on purpose: policy and infrastructure state live in this process.
+    # loop/http "auto" pick uvloop and httptools when they are installed.
+    uvicorn.run(app, host="0.0.0.0", port=8000, limit_concurrency=1000)
@@ -4,13 +4,67 @@ Mock Cloud Infrastructure Tools
 Simulates cloud infrastructure with realistic service management.
 """
 
-from typing import Dict, Any, List
-from datetime import datetime
+import os
+import sys
+import time
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from collections import deque
+
+EXECUTION_LOG_SIZE = 100
+RECENT_LOG_SIZE = 10
+UNHEALTHY_STATES = frozenset(("critical", "degraded"))
+
+_HEALTH_EMOJI = {
+    "healthy": "✅",
+    "degraded": "⚠️",
+    "critical": "🔴"
+}
+MIN_FLEET_SIZE = 1
+MAX_FLEET_SIZE = 100
+_FLEET_TOO_SMALL = {"status": "error", "message": f"Fleet size must be at least {MIN_FLEET_SIZE}"}
+_FLEET_TOO_LARGE = {"status": "error", "message": f"Fleet size cannot exceed {MAX_FLEET_SIZE}"}
+
+_LOG_TEMPLATES = {
+    "healthy": "[INFO] {}: Operating normally",
+    "degraded": "[WARN] {}: Performance degraded",
+    "critical": "[ERROR] {}: Critical issues detected!"
+}
+
+
+# [whole second, "YYYY-MM-DDTHH:MM:SS" local-time prefix] of the last timestamp
+_ts_prefix_cache = [-1, ""]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string (taken once per public call).
+    
+    The seconds prefix is formatted once per wall-clock second; calls within
+    the same second only append the microseconds.
+    """
+    t = time.time()
+    second = int(t)
+    if second != _ts_prefix_cache[0]:
+        _ts_prefix_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _ts_prefix_cache[0] = second
+    return "%s.%06d" % (_ts_prefix_cache[1], int((t - second) * 1e6))
 
 
 class CloudInfrastructure:
     """Mock cloud infrastructure with service health tracking."""
     
+    # Every attribute set in __init__ must be listed here
+    __slots__ = (
+        "services",
+        "_service_names",
+        "_list_services_static",
+        "_unhealthy_services",
+        "fleet_size",
+        "_state_version",
+        "_logging_enabled",
+        "execution_log",
+        "recent_log",
+    )
+    
     def __init__(self):
         self.services = {
             "web-server": "healthy",
@@ -19,122 +73,185 @@ class CloudInfrastructure:
             "cache": "healthy",
             "load-balancer": "healthy"
         }
+        # The service set never changes after construction; refresh this if
+        # services are ever added or removed
+        self._service_names = tuple(self.services)
+        # Fixed part of list_services(); the names are the shared immutable tuple
+        self._list_services_static = {
+            "services": self._service_names,
+            "count": len(self._service_names)
+        }
+        # Kept in step with self.services by set_service_health / restart_service
+        self._unhealthy_services = {
+            name for name, health in self.services.items() if health in UNHEALTHY_STATES
+        }
         self.fleet_size = 3
-        self.execution_log = []
+        # Bumped on every health or fleet size change (not on reads or log entries)
+        self._state_version = 0
+        # PROXI_LOG_ACTIONS=0 turns the action log off (nothing is recorded or formatted)
+        self._logging_enabled = os.environ.get("PROXI_LOG_ACTIONS", "1") == "1"
+        # Entries are compact (timestamp, action, details) tuples; the dict view is
+        # only built when the log is read (see get_execution_log / get_recent_actions)
+        self.execution_log = deque(maxlen=EXECUTION_LOG_SIZE)  # oldest entries drop off
+        self.recent_log = deque(maxlen=RECENT_LOG_SIZE)  # last few actions for status views
     
     def list_services(self) -> Dict[str, Any]:
         """List all available services."""
-        self._log_action("list_services", {})
+        ts = _now_iso()
+        self._log_action("list_services", {}, ts)
+        return {**self._list_services_static, "timestamp": ts}
+    
+    def _log_action(self, action: str, details: Dict[str, Any], ts: Optional[str] = None) -> None:
+        """Log infrastructure actions (reuses the caller's timestamp when given)."""
+        if not self._logging_enabled:
+            return
+        log_entry = (ts or _now_iso(), action, details)
+        self.execution_log.append(log_entry)
+        self.recent_log.append(log_entry)
+    
+    @staticmethod
+    def _log_dicts(entries: Iterable[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        return [
+            {"timestamp": ts, "action": action, "details": details}
+            for ts, action, details in entries
+        ]
+    
+    def get_execution_log(self) -> List[Dict[str, Any]]:
+        """Full action log (oldest first) as timestamp/action/details dicts."""
+        return self._log_dicts(self.execution_log)
+    
+    def get_recent_actions(self) -> List[Dict[str, Any]]:
+        """The last few actions (oldest first) as timestamp/action/details dicts."""
+        return self._log_dicts(self.recent_log)
+    
+    def _service_not_found(self, service_name: str) -> Dict[str, Any]:
+        """Error result for an unknown service name."""
         return {
-            "services": list(self.services.keys()),
-            "count": len(self.services),
-            "timestamp": datetime.now().isoformat()
+            "status": "error",
+            "message": f"Service '{service_name}' not found",
+            "available_services": self._service_names
         }
     
-    def _log_action(self, action: str, details: Dict[str, Any]) -> None:
-        """Log infrastructure actions."""
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "details": details
-        }
-        self.execution_log.append(log_entry)
-        if len(self.execution_log) > 100:
-            self.execution_log = self.execution_log[-100:]
+    def _apply_health(self, service: str, status: str) -> str:
+        """Store a known service's new health and return the previous one."""
+        # Request-supplied strings are interned so later health comparisons and
+        # table lookups hit the identity fast path like the literals do
+        status = sys.intern(status)
+        old_status = self.services[service]
+        self.services[service] = status
+        self._state_version += 1
+        if status in UNHEALTHY_STATES:
+            self._unhealthy_services.add(service)
+        else:
+            self._unhealthy_services.discard(service)
+        return old_status
     
     def set_service_health(self, service: str, status: str) -> None:
         """Set service health status."""
         if service in self.services:
-            old_status = self.services[service]
-            self.services[service] = status
+            old_status = self._apply_health(service, status)
             self._log_action("health_change", {
                 "service": service,
                 "old_status": old_status,
                 "new_status": status
             })
     
-    def get_unhealthy_services(self) -> List[str]:
-        """Get list of unhealthy services."""
-        return [
-            name for name, health in self.services.items()
-            if health in ["critical", "degraded"]
-        ]
+    def set_service_health_bulk(self, updates: Dict[str, str]) -> None:
+        """Set several service health statuses under a single log entry."""
+        changes = []
+        for service, status in updates.items():
+            if service in self.services:
+                changes.append({
+                    "service": service,
+                    "old_status": self._apply_health(service, status),
+                    "new_status": status
+                })
+        if changes:
+            self._log_action("health_change_bulk", {"changes": changes})
+    
+    @property
+    def state_version(self) -> int:
+        """Counter bumped on every health or fleet change (read-only; use as a cache key)."""
+        return self._state_version
+    
+    def get_unhealthy_services(self) -> Tuple[str, ...]:
+        """Get unhealthy services (an immutable snapshot, in service order)."""
+        # Walk the fixed name tuple rather than the set so the order is stable
+        unhealthy = self._unhealthy_services
+        return tuple(name for name in self._service_names if name in unhealthy)
     
     def get_service_status(self, service_name: str = None) -> Dict[str, Any]:
         """Get service health status."""
-        self._log_action("get_service_status", {"service": service_name})
+        ts = _now_iso()
+        self._log_action("get_service_status", {"service": service_name}, ts)
         
         if service_name:
             if service_name not in self.services:
-                return {
-                    "status": "error",
-                    "message": f"Service '{service_name}' not found",
-                    "available_services": list(self.services.keys())
-                }
+                return self._service_not_found(service_name)
             
             health = self.services[service_name]
-            health_emoji = {
-                "healthy": "✅",
-                "degraded": "⚠️",
-                "critical": "🔴"
-            }.get(health, "❓")
-            
             return {
                 "service": service_name,
                 "health": health,
-                "status_emoji": health_emoji,
+                "status_emoji": _HEALTH_EMOJI.get(health, "❓"),
                 "is_healthy": health == "healthy",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": ts
             }
         else:
             unhealthy = self.get_unhealthy_services()
+            unhealthy_count = len(unhealthy)
+            # "services" is the live dict, not a copy: callers must treat it as read-only
             return {
                 "services": self.services,
                 "fleet_size": self.fleet_size,
-                "unhealthy_count": len(unhealthy),
+                "unhealthy_count": unhealthy_count,
                 "unhealthy_services": unhealthy,
-                "all_healthy": len(unhealthy) == 0,
-                "timestamp": datetime.now().isoformat()
+                "all_healthy": unhealthy_count == 0,
+                "timestamp": ts
             }
     
     def read_logs(self, lines: int = 10) -> Dict[str, Any]:
         """Read system logs."""
-        self._log_action("read_logs", {"lines": lines})
+        ts = _now_iso()
+        self._log_action("read_logs", {"lines": lines}, ts)
         
+        # Only format the lines the caller will get; the rest are just counted
         log_entries = []
+        service_lines = 0
         for service, health in self.services.items():
-            if health == "healthy":
-                log_entries.append(f"[INFO] {service}: Operating normally")
-            elif health == "degraded":
-                log_entries.append(f"[WARN] {service}: Performance degraded")
-            elif health == "critical":
-                log_entries.append(f"[ERROR] {service}: Critical issues detected!")
+            template = _LOG_TEMPLATES.get(health)
+            if template is None:
+                continue
+            service_lines += 1
+            if service_lines <= lines:
+                log_entries.append(template.format(service))
         
-        log_entries.extend([
-            f"[INFO] Fleet: {self.fleet_size} instances active",
-            f"[INFO] Total services: {len(self.services)}",
-            f"[INFO] Execution log: {len(self.execution_log)} entries"
-        ])
+        if len(log_entries) < lines:
+            log_entries.extend([
+                f"[INFO] Fleet: {self.fleet_size} instances active",
+                f"[INFO] Total services: {len(self.services)}",
+                f"[INFO] Execution log: {len(self.execution_log)} entries"
+            ])
+            del log_entries[lines:]
         
         return {
-            "log_lines": log_entries[:lines],
-            "timestamp": datetime.now().isoformat(),
-            "total_available": len(log_entries)
+            "log_lines": log_entries,
+            "timestamp": ts,
+            "total_available": service_lines + 3
         }
     
     def restart_service(self, service_name: str) -> Dict[str, Any]:
         """Restart a service."""
-        self._log_action("restart_service", {"service": service_name})
+        ts = _now_iso()
+        self._log_action("restart_service", {"service": service_name}, ts)
         
         if service_name not in self.services:
-            return {
-                "status": "error",
-                "message": f"Service '{service_name}' not found",
-                "available_services": list(self.services.keys())
-            }
+            return self._service_not_found(service_name)
         
         old_health = self.services[service_name]
         self.services[service_name] = "healthy"
+        self._unhealthy_services.discard(service_name)
+        self._state_version += 1
         
         return {
             "status": "success",
@@ -143,21 +260,21 @@ class CloudInfrastructure:
             "old_health": old_health,
             "new_health": "healthy",
             "message": f"Service '{service_name}' restarted successfully",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
     
     def scale_fleet(self, count: int) -> Dict[str, Any]:
         """Scale fleet size."""
-        self._log_action("scale_fleet", {"target_count": count})
-        
-        if count < 1:
-            return {"status": "error", "message": "Fleet size must be at least 1"}
+        ts = _now_iso()
+        self._log_action("scale_fleet", {"target_count": count}, ts)
         
-        if count > 100:
-            return {"status": "error", "message": "Fleet size cannot exceed 100"}
+        if not MIN_FLEET_SIZE <= count <= MAX_FLEET_SIZE:
+            # Copies, so a caller editing the result cannot change the shared constant
+            return dict(_FLEET_TOO_SMALL if count < MIN_FLEET_SIZE else _FLEET_TOO_LARGE)
         
         old_size = self.fleet_size
         self.fleet_size = count
+        self._state_version += 1
         
         return {
             "status": "success",
@@ -166,40 +283,21 @@ class CloudInfrastructure:
             "new_size": count,
             "change": count - old_size,
             "message": f"Fleet scaled from {old_size} to {count} instances",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
     
     def delete_database(self, db_name: str) -> Dict[str, Any]:
         """Delete database (should never execute)."""
-        self._log_action("delete_database_attempt", {"db_name": db_name})
+        ts = _now_iso()
+        self._log_action("delete_database_attempt", {"db_name": db_name}, ts)
         
         return {
             "status": "error",
             "message": "This operation should never execute - policy violation!",
             "db_name": db_name,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
 
 
 # Global instance
 cloud_infra = CloudInfrastructure()
-
-
-# Tool wrappers
-def get_service_status(service_name: str = None) -> str:
-    return str(cloud_infra.get_service_status(service_name))
-
-def list_services() -> str:
-    return str(cloud_infra.list_services())
-
-def read_logs(lines: int = 10) -> str:
-    return str(cloud_infra.read_logs(lines))
-
-def restart_service(service_name: str) -> str:
-    return str(cloud_infra.restart_service(service_name))
-
-def scale_fleet(count: int) -> str:
-    return str(cloud_infra.scale_fleet(count))
-
-def delete_database(db_name: str) -> str:
-    return str(cloud_infra.delete_database(db_name))